@@ -1,13 +1,28 @@
 # AI 뉴스 생성기 - 임원용 보고서 확장 버전 #
-import requests
-import feedparser
-import json
 import os
 import time 
 
+from asset_builder import AssetBuilder
+from date_normalizer import DateNormalizer
+from extraction_cache import ArticleExtractionCache
+from feed_fetcher import FeedCache, FeedFetcher
+from http_client import create_session
+from keyword_history import KeywordHistoryStore
+from keyword_index import KeywordIndex
+from llm_cache import LLMResponseCache
+from llm_providers import ClaudeProvider, GeminiProvider, StubProvider
+from llm_stream import PartialJSONParser
+from output_writer import OutputWriter, Volatile
+from prompt_budget import PromptBuilder, estimate_tokens
+from site_builder import SiteBuilder, content_hash
+from story_cluster import StoryClusterer
+from template_renderer import TemplateRenderer
+from trend_scoring import TrendScorer
+
 class AINewsWebGenerator:
-    def __init__(self):
+    def __init__(self, llm_providers=None):
         self.gemini_api_key = os.getenv('GEMINI_API_KEY')
+        self.claude_api_key = os.getenv('CLAUDE_API_KEY')
         
         # AI 뉴스 RSS 피드들
         self.news_sources = [
@@ -21,42 +36,253 @@ class AINewsWebGenerator:
             'https://techxplore.com/rss-feed/technology-news/',
             'https://www.sciencedaily.com/rss/computers_math/artificial_intelligence.xml'
         ]
+        
+        # 최종 기사 수 (최대 / 24시간 뉴스가 이보다 적으면 48시간·날짜 미상으로 보충)
+        self.max_articles = 15
+        self.min_articles = 10
+        
+        # 요약(map-reduce)에 쓰는 기사 수 (화면에 보여줄 기사와 별개로 48시간 이내 최신순)
+        self.max_digest_articles = 200
+        self.digest_articles = []
+        
+        # 여러 매체에 실린 같은 소식 묶기 (MinHash/LSH)
+        self.story_clusterer = StoryClusterer()
+        
+        # 키워드 분석 설정
+        # 기술/응용 분야 중심 핵심 키워드
+        self.core_keywords = [
+            'autonomous', 'medical', 'healthcare', 'education', 
+            'coding', 'robotics', 'vision', 'voice', 'multimodal'
+        ]
+        
+        # 진짜 기본적인 불용어만 (문제 단어들 대폭 추가)
+        self.stop_words = {
+            'the', 'and', 'for', 'are', 'with', 'this', 'that', 'from',
+            'will', 'can', 'said', 'more', 'about', 'than', 'also', 'have',
+            'when', 'where', 'what', 'how', 'why', 'who', 'which',
+            'been', 'they', 'their', 'would', 'could', 'should', 'much',
+            # 웹 관련 + 분리된 단어들 + 문제 단어들 (모두 소문자)
+            'href', 'https', 'www', 'http', 'html', 'com', 'you',
+            'chat', 'gpt', 'machine', 'learning', 'deep', 'artificial',
+            'new', 'search', 'agent', 'news', 'research', 'its', 'openai'
+        }
+        
+        # 특별 키워드 (새로운 AI 도구/회사들)
+        self.special_keywords = {
+            'sora', 'devin', 'claude', 'gemini', 'midjourney', 'cursor', 
+            'perplexity', 'runway', 'stability', 'cohere', 'replicate',
+            'huggingface', 'github', 'copilot', 'tesla', 'waymo'
+        }
+        
+        # 복합 키워드 우선 처리 (띄어쓰기 문제 해결)
+        self.compound_keywords = {
+            'chatgpt': ['chat gpt', 'chatgpt'],
+            'machine learning': ['machine learning'],
+            'deep learning': ['deep learning'], 
+            'artificial intelligence': ['artificial intelligence'],
+            'claude ai': ['claude ai', 'claude 3', 'claude 3.5'],
+            'gemini pro': ['gemini pro', 'gemini advanced'],
+            'github copilot': ['github copilot'],
+            'openai gpt': ['openai gpt', 'gpt-4', 'gpt-5']
+        }
+        
+        # 기사별 키워드 집계 캐시 (새 기사만 토큰화)
+        self.keyword_index = KeywordIndex(
+            'keyword_index.json',
+            stop_words=self.stop_words,
+            compound_keywords=self.compound_keywords
+        )
+        
+        # 키워드 일간 빈도 기록 (최근 30일 기록으로 트렌드 점수 계산)
+        self.trend_history_days = 30
+        self.trend_scorer = TrendScorer()
+        self.keyword_history = KeywordHistoryStore('keyword_history.db')
+        self.keyword_history.import_json(
+            'yesterday_keywords.json', time.strftime('%Y-%m-%d', time.localtime(time.time() - 24 * 3600))
+        )
+        
+        # 요약 프롬프트 버전 (프롬프트를 고치면 버전을 올려 캐시 무효화)
+        self.summary_prompt_version = 'summary-v3'
+        
+        # 아카이브 렌더링 버전 (페이지를 만드는 코드를 고치면 올려서 지난 페이지 전체 다시 빌드)
+        self.site_version = 'site-v1'
+        
+        # LLM 제공자별 설정 (모델, API 주소, 동시 호출 수, 분당 호출 수, 타임아웃 초, 100만 토큰당 USD 단가)
+        # GEMINI_BASE_URL / CLAUDE_BASE_URL로 llm_stub_server.py 같은 로컬 서버를 가리킬 수 있다
+        self.llm_provider_config = {
+            'gemini': {
+                'provider': 'gemini',
+                'model': 'gemini-1.5-flash-latest',
+                'base_url': os.getenv('GEMINI_BASE_URL'),
+                'concurrency': 4,
+                'requests_per_minute': 15,
+                'timeout': 30,
+                'input_price': 0.075,
+                'output_price': 0.30
+            },
+            'gemini-pro': {
+                'provider': 'gemini',
+                'model': 'gemini-1.5-pro-latest',
+                'base_url': os.getenv('GEMINI_BASE_URL'),
+                'concurrency': 2,
+                'requests_per_minute': 2,
+                'timeout': 60,
+                'input_price': 1.25,
+                'output_price': 5.00
+            },
+            'claude': {
+                'provider': 'claude',
+                'model': 'claude-sonnet-4-20250514',
+                'base_url': os.getenv('CLAUDE_BASE_URL'),
+                'concurrency': 2,
+                'requests_per_minute': 50,
+                'timeout': 60,
+                'input_price': 3.00,
+                'output_price': 15.00
+            },
+            'stub': {
+                'provider': 'stub',
+                'model': 'offline-stub',
+                'concurrency': 8,
+                'requests_per_minute': 600,
+                'timeout': 5,
+                'input_price': 0.0,
+                'output_price': 0.0
+            }
+        }
+        
+        # 제공자 순서 (앞 제공자가 재시도 후에도 실패하면 다음으로, LLM_PROVIDERS 환경변수로 변경)
+        self.llm_provider_names = llm_providers or os.getenv('LLM_PROVIDERS', 'gemini,gemini-pro,claude').split(',')
+        
+        # 프롬프트 토큰 예산 (기사 분석 / 오늘의 요약, 기사 요약 한 개당 최대 토큰)
+        self.prompt_config = {
+            'extract_tokens': 2000,
+            'overview_tokens': 1200,
+            'summary_tokens': 60
+        }
+        self.prompt_builder = PromptBuilder(summary_tokens=self.prompt_config['summary_tokens'])
+        
+        # LLM 재시도 설정 (최대 시도 횟수, 백오프 초, 호출당 마감 초)
+        self.llm_config = {
+            'max_attempts': 4,
+            'base_delay': 1.0,
+            'max_delay': 30,
+            'deadline': 120
+        }
+        
+        # HTTP 설정 (커넥션 풀 크기, GET 재시도, 타임아웃)
+        self.http_config = {
+            'pool_size': 10,
+            'retries': 2,
+            'backoff_factor': 0.5,
+            'feed_timeout': 15,
+            'feed_total_timeout': 45,
+            'llm_timeout': 30
+        }
+        
+        # 피드와 LLM 호출이 함께 쓰는 keep-alive 세션
+        self.session = create_session(
+            pool_size=self.http_config['pool_size'],
+            retries=self.http_config['retries'],
+            backoff_factor=self.http_config['backoff_factor'],
+            timeout=self.http_config['llm_timeout']
+        )
+        
+        # 기사 날짜 정규화 (소스별 날짜 형식 기억, UTC 기준)
+        self.date_normalizer = DateNormalizer()
+        
+        # LLM 제공자 목록 (같은 세션 사용, 제공자별 동시 호출/속도 제한/비용 집계)
+        self.llm_chain = [
+            self.create_provider(name.strip()) for name in self.llm_provider_names
+            if name.strip() in self.llm_provider_config
+        ]
+        
+        # 이번 요약에서 실제로 응답한 제공자 (대체 제공자 응답은 주 모델 캐시에 넣지 않음)
+        self.answered_providers = set()
+        
+        # 스텁/로컬 서버 응답이 실제 API 응답 캐시에 섞이지 않도록 캐시 키에 넣는 구분값
+        self.llm_cache_scope = ','.join(dict.fromkeys(
+            scope for scope in (provider.cache_scope() for provider in self.llm_chain) if scope
+        ))
+        
+        # LLM 응답 캐시 (24시간, 최대 50개)
+        self.llm_cache = LLMResponseCache('llm_cache.json', ttl_hours=24, max_entries=50)
+        
+        # 기사별 분석 결과 캐시 (새 기사만 API로 분석)
+        self.extraction_cache = ArticleExtractionCache(
+            'article_extractions.json', prompt_version='extract-v1', scope=self.llm_cache_scope
+        )
+        
+        # HTML 템플릿 (처음 쓸 때 한 번만 컴파일해 재사용)
+        self.renderer = TemplateRenderer('templates')
+        
+        # 결과 파일 원자적 기록 (내용 해시가 같으면 기록/배포 생략)
+        self.output_writer = OutputWriter('output_hashes.json')
+        
+        # CSS/JS는 내용 해시가 붙은 파일로 내보내 오래 캐시 (HTML에는 링크만)
+        self.asset_builder = AssetBuilder(self.output_writer, 'static', 'assets')
+        
+        # 날짜별 아카이브 (입력 해시가 바뀐 페이지만 다시 빌드)
+        self.site_builder = SiteBuilder(
+            self.output_writer,
+            self.render_archive_day,
+            self.render_archive_index,
+            data_dir='archive_data',
+            archive_dir='archive',
+            manifest_path='site_manifest.json'
+        )
+        
+        # 피드 동시 수집 + 조건부 GET 캐시
+        self.feed_fetcher = FeedFetcher(
+            max_workers=8,
+            feed_timeout=self.http_config['feed_timeout'],
+            total_timeout=self.http_config['feed_total_timeout'],
+            cache=FeedCache('feed_cache.json'),
+            session=self.session,
+            date_normalizer=self.date_normalizer
+        )
+    
+    def create_provider(self, name):
+        """설정 이름 → LLM 제공자 객체"""
+        config = dict(self.llm_provider_config[name])
+        provider = config.pop('provider')
+        provider_class = {'gemini': GeminiProvider, 'claude': ClaudeProvider, 'stub': StubProvider}[provider]
+        api_key = {'gemini': self.gemini_api_key, 'claude': self.claude_api_key}.get(provider)
+        return provider_class(
+            config.pop('model'),
+            api_key=api_key,
+            session=self.session,
+            max_attempts=self.llm_config['max_attempts'],
+            base_delay=self.llm_config['base_delay'],
+            max_delay=self.llm_config['max_delay'],
+            **config
+        )
     
     def collect_news(self):
         """최신 뉴스 수집 (24시간 우선, 부족하면 48시간)"""
-        from datetime import datetime, timedelta
+        from datetime import datetime, timedelta, timezone
+        import heapq
         
-        all_articles = []
-        now = datetime.now()
+        # 기사 날짜와 같은 UTC 기준으로 비교
+        now = datetime.now(timezone.utc)
         yesterday = now - timedelta(days=1)
         two_days_ago = now - timedelta(days=2)
         
-        print(f"🕐 우선 {yesterday.strftime('%Y-%m-%d %H:%M')} 이후 뉴스를 수집합니다")
+        print(f"🕐 우선 {yesterday.astimezone().strftime('%Y-%m-%d %H:%M')} 이후 뉴스를 수집합니다")
         
-        recent_articles = []
-        older_articles = []
-        no_date_articles = []
+        # 제목 기준으로 중복을 거르며 한 번에 수집 (같은 제목이면 더 최신 기사 유지)
+        unique_articles = {}
         
-        for source in self.news_sources:
+        # 소스별 최신 20개까지, 48시간 이전 기사가 나오면 그 피드는 더 읽지 않음
+        feeds = self.feed_fetcher.fetch_all(
+            self.news_sources, max_entries=20, cutoff=two_days_ago.timestamp()
+        )
+        for source, feed in feeds:
             try:
-                print(f"📡 {source}에서 뉴스 수집 중...")
-                feed = feedparser.parse(source)
-                
-                for entry in feed.entries[:20]:
-                    article_date = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        try:
-                            article_date = datetime(*entry.published_parsed[:6])
-                        except:
-                            pass
-                    elif hasattr(entry, 'published') and entry.published:
-                        try:
-                            from dateutil import parser
-                            article_date = parser.parse(entry.published)
-                            if article_date.tzinfo:
-                                article_date = article_date.replace(tzinfo=None)
-                        except:
-                            pass
+                for entry in feed.entries:
+                    article_date = self.date_normalizer.from_entry(entry, source)
+                    if article_date and article_date < two_days_ago:
+                        continue
                     
                     article = {
                         'title': entry.title,
@@ -67,156 +293,126 @@ class AINewsWebGenerator:
                         'date_obj': article_date
                     }
                     
-                    if article_date:
-                        if article_date >= yesterday:
-                            recent_articles.append(article)
-                            print(f"✅ 최신 뉴스 (24h): {article['title'][:50]}...")
-                        elif article_date >= two_days_ago:
-                            older_articles.append(article)
-                            print(f"🔄 이전 뉴스 (48h): {article['title'][:50]}...")
-                    else:
-                        no_date_articles.append(article)
+                    title_key = article['title'].lower().strip()
+                    previous = unique_articles.get(title_key)
+                    if previous is not None:
+                        if not article_date or (previous['date_obj'] and previous['date_obj'] >= article_date):
+                            continue
+                    unique_articles[title_key] = article
+                    
+                    if not article_date:
                         print(f"📅 날짜 미상: {article['title'][:50]}...")
+                    elif article_date >= yesterday:
+                        print(f"✅ 최신 뉴스 (24h): {article['title'][:50]}...")
+                    else:
+                        print(f"🔄 이전 뉴스 (48h): {article['title'][:50]}...")
                             
             except Exception as e:
-                print(f"❌ Error fetching from {source}: {e}")
+                print(f"❌ Error parsing {source}: {e}")
+        
+        # 제목이 조금씩 다른 같은 소식은 대표 기사 하나로 묶기
+        stories = self.story_clusterer.merge(list(unique_articles.values()))
+        print(f"🧩 유사 기사 묶음: {len(unique_articles)}개 기사 → {len(stories)}개 스토리")
+        
+        recent_articles = []
+        older_articles = []
+        no_date_articles = []
+        for article in stories:
+            if not article['date_obj']:
+                no_date_articles.append(article)
+            elif article['date_obj'] >= yesterday:
+                recent_articles.append(article)
+            else:
+                older_articles.append(article)
         
-        recent_articles.sort(key=lambda x: x['date_obj'], reverse=True)
-        older_articles.sort(key=lambda x: x['date_obj'], reverse=True)
+        # 전체 정렬 대신 필요한 개수만 힙으로 선택 (O(n log k))
+        by_date = lambda x: x['date_obj']
+        max_count = self.max_articles
+        min_count = self.min_articles
         
-        if len(recent_articles) >= 10:
-            final_articles = recent_articles[:15]
+        if len(recent_articles) >= min_count:
+            final_articles = heapq.nlargest(max_count, recent_articles, key=by_date)
             print(f"📊 24시간 이내 뉴스 충분: {len(final_articles)}개 사용")
         else:
-            needed_count = 15 - len(recent_articles)
-            final_articles = recent_articles + older_articles[:needed_count]
+            needed_count = max_count - len(recent_articles)
+            final_articles = (
+                heapq.nlargest(len(recent_articles), recent_articles, key=by_date)
+                + heapq.nlargest(needed_count, older_articles, key=by_date)
+            )
             print(f"📊 24시간 뉴스 부족 → 48시간 이내 뉴스 추가: 총 {len(final_articles)}개")
             
-            if len(final_articles) < 10:
-                still_needed = 10 - len(final_articles)
+            if len(final_articles) < min_count:
+                still_needed = min_count - len(final_articles)
                 final_articles.extend(no_date_articles[:still_needed])
                 print(f"📊 여전히 부족 → 날짜 미상 뉴스 추가: 총 {len(final_articles)}개")
         
-        seen_titles = set()
-        unique_articles = []
-        for article in final_articles:
-            title_key = article['title'].lower().strip()
-            if title_key not in seen_titles:
-                seen_titles.add(title_key)
-                unique_articles.append(article)
+        print(f"🎯 최종 선택: {len(final_articles)}개 뉴스")
         
-        print(f"🎯 최종 선택: {len(unique_articles)}개 뉴스")
+        # 요약은 화면에 보여줄 기사보다 넓게, 48시간 이내 스토리 전체에서 최신순으로
+        dated_articles = heapq.nlargest(self.max_digest_articles, recent_articles + older_articles, key=by_date)
+        self.digest_articles = dated_articles + no_date_articles[:self.max_digest_articles - len(dated_articles)]
+        print(f"🗞️ 요약 대상: {len(self.digest_articles)}개 스토리")
         
-        return unique_articles[:15]
+        return final_articles
     
-    def analyze_keywords_optimal(self, articles):
-        """최적화된 키워드 추출 (빈도 3회 + 특별 키워드)"""
+    def count_keywords(self, articles):
+        """전체 키워드 빈도 계산 (빈도 3회 + 특별 키워드)"""
         from collections import Counter
-        import re
         
-        # 모든 뉴스 텍스트 합치기
-        all_text = ""
-        for article in articles:
-            title = article.get('title', '').lower()
-            summary = article.get('summary', '').lower()
-            all_text += f" {title} {summary}"
-        
-        # 기술/응용 분야 중심 핵심 키워드
-        core_keywords = [
-            'autonomous', 'medical', 'healthcare', 'education', 
-            'coding', 'robotics', 'vision', 'voice', 'multimodal'
-        ]
+        # 기사별 집계 벡터 합산 (어제 이미 본 기사는 캐시 재사용)
+        word_freq = Counter()
+        capitalized_words = {}
+        compound_counts = Counter()
+        unigram_counts = Counter()
+        for vector in self.keyword_index.vectors(articles):
+            word_freq.update(vector['words'])
+            capitalized_words.update(dict.fromkeys(vector['capitalized'], True))
+            compound_counts.update(vector['compounds'])
+            unigram_counts.update(vector['unigrams'])
         
         # 자동 단어 추출
-        # 대문자로 시작하는 단어들 (회사명, 제품명)
-        capitalized_words = re.findall(r'\b[A-Z][a-z]{2,15}\b', all_text.title())
-        
-        # 일반 단어들 (3글자 이상)
-        regular_words = re.findall(r'\b[a-z]{3,15}\b', all_text)
-        
-        # 진짜 기본적인 불용어만 (문제 단어들 대폭 추가)
-        stop_words = {
-            'the', 'and', 'for', 'are', 'with', 'this', 'that', 'from',
-            'will', 'can', 'said', 'more', 'about', 'than', 'also', 'have',
-            'when', 'where', 'what', 'how', 'why', 'who', 'which',
-            'been', 'they', 'their', 'would', 'could', 'should', 'much',
-            # 웹 관련 + 분리된 단어들 + 문제 단어들 (모두 소문자)
-            'href', 'https', 'www', 'http', 'html', 'com', 'you',
-            'chat', 'gpt', 'machine', 'learning', 'deep', 'artificial',
-            'new', 'search', 'agent', 'news', 'research', 'its', 'openai'
-        }
-        
-        # 특별 키워드 (새로운 AI 도구/회사들)
-        special_keywords = {
-            'sora', 'devin', 'claude', 'gemini', 'midjourney', 'cursor', 
-            'perplexity', 'runway', 'stability', 'cohere', 'replicate',
-            'huggingface', 'github', 'copilot', 'tesla', 'waymo'
-        }
-        
-        auto_keywords = []
-        
-        # 대문자 단어들 (회사명, 제품명 가능성 높음) - 불용어 필터링 추가
-        for word in set(capitalized_words):
-            if word.lower() not in stop_words and len(word) >= 3:
-                auto_keywords.append(word)
-        
-        # 일반 단어들 중 빈도 높은 것들 - 불용어 필터링 강화
-        word_freq = Counter([word for word in regular_words 
-                            if word not in stop_words and len(word) >= 3])
+        # 대문자로 시작하는 단어들 (회사명, 제품명 가능성 높음)
+        auto_keywords = list(capitalized_words)
         
         # 빈도 5회 이상으로 올림 (특별 키워드는 3회도 허용)
         for word, freq in word_freq.items():
-            if freq >= 5 or (freq >= 3 and word.lower() in special_keywords):
+            if freq >= 5 or (freq >= 3 and word.lower() in self.special_keywords):
                 auto_keywords.append(word.title())
         
         # 전체 키워드 통합
-        all_keywords = core_keywords + auto_keywords
-        
-        # 복합 키워드 우선 처리 (띄어쓰기 문제 해결)
-        compound_keywords = {
-            'chatgpt': ['chat gpt', 'chatgpt'],
-            'machine learning': ['machine learning'],
-            'deep learning': ['deep learning'], 
-            'artificial intelligence': ['artificial intelligence'],
-            'claude ai': ['claude ai', 'claude 3', 'claude 3.5'],
-            'gemini pro': ['gemini pro', 'gemini advanced'],
-            'github copilot': ['github copilot'],
-            'openai gpt': ['openai gpt', 'gpt-4', 'gpt-5']
-        }
-        
-        keyword_counts = Counter()
-        
-        # 1. 복합 키워드 먼저 계산
-        for display_name, patterns in compound_keywords.items():
-            total_count = 0
-            for pattern in patterns:
-                total_count += all_text.count(pattern.lower())
-            if total_count > 0:
-                keyword_counts[display_name.title()] = total_count
-                # 복합 키워드 부분들을 텍스트에서 제거 (중복 방지)
-                for pattern in patterns:
-                    all_text = all_text.replace(pattern.lower(), '')
+        all_keywords = self.core_keywords + auto_keywords
         
-        # 2. 일반 키워드 계산 (복합 키워드 제거 후)
+        # 복합 키워드는 기사별로 이미 긴 매치 우선으로 집계되어 있고,
+        # 단일 키워드는 복합 키워드에 포함되지 않은 단어 빈도로 계산
+        keyword_counts = Counter(compound_counts)
+        seen_words = set()
         for keyword in all_keywords:
-            count = all_text.count(keyword.lower())
-            if count > 0:
-                # 표시명 정리
-                if keyword.lower() in ['ai', 'gpt', 'llm', 'api', 'ceo', 'cto']:
-                    display_name = keyword.upper()
-                elif keyword.lower() in special_keywords:
-                    display_name = keyword.title()
-                else:
-                    display_name = keyword.title()
-                
-                keyword_counts[display_name] = count
+            word = keyword.lower()
+            if word in seen_words:
+                continue
+            seen_words.add(word)
+            # 표시명 정리
+            if word in ['ai', 'gpt', 'llm', 'api', 'ceo', 'cto']:
+                display_name = keyword.upper()
+            else:
+                display_name = keyword.title()
+            if unigram_counts[word] > 0:
+                keyword_counts[display_name] += unigram_counts[word]
+        
+        return keyword_counts
+    
+    def analyze_keywords_optimal(self, articles, keyword_counts=None):
+        """최적화된 키워드 추출 (상위 10개)"""
+        if keyword_counts is None:
+            keyword_counts = self.count_keywords(articles)
         
         # 상위 10개 반환
         top_keywords = dict(keyword_counts.most_common(10))
         
         print(f"🔍 최적화된 키워드 분석: {len(top_keywords)}개 발견")
-        print(f"  📋 핵심 키워드: {len([k for k in core_keywords if k in all_text])}개")
-        print(f"  🔍 자동 발견: {len(top_keywords) - len([k for k in core_keywords if k in all_text])}개")
+        core_found = len([k for k in self.core_keywords if keyword_counts[k.title()] > 0])
+        print(f"  📋 핵심 키워드: {core_found}개")
+        print(f"  🔍 자동 발견: {len(top_keywords) - core_found}개")
         
         # 상위 5개 키워드 미리보기
         for i, (keyword, count) in enumerate(list(top_keywords.items())[:5]):
@@ -224,75 +420,69 @@ class AINewsWebGenerator:
         
         return top_keywords
     
-    def load_yesterday_keywords(self):
-        """어제 키워드 데이터 불러오기"""
+    def load_keyword_history(self, keywords):
+        """최근 키워드 일간 빈도 불러오기 (키워드 × 날짜 행렬)"""
+        from datetime import date, timedelta
+        
+        today = date.today()
+        start_day = (today - timedelta(days=self.trend_history_days)).isoformat()
+        end_day = (today - timedelta(days=1)).isoformat()
         try:
-            with open('yesterday_keywords.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                print(f"📋 어제 키워드 불러옴: {len(data)}개")
-                return data
-        except FileNotFoundError:
-            print("📋 어제 키워드 파일 없음 (첫 실행)")
-            return {}
+            # 실행 기록이 있는 날만 열로 사용 (실패한 날은 0으로 치지 않음)
+            days = self.keyword_history.days(start_day, end_day)
+            history = self.keyword_history.history(keywords, start_day, end_day) if days else {}
         except Exception as e:
-            print(f"❌ 어제 키워드 불러오기 실패: {e}")
-            return {}
+            print(f"❌ 키워드 기록 불러오기 실패: {e}")
+            return None
+        if not days:
+            print("📋 이전 키워드 기록 없음 (첫 실행)")
+            return None
+        print(f"📋 최근 {len(days)}일 키워드 기록 불러옴: {len(keywords)}개 키워드")
+        return {
+            'days': days,
+            'matrix': self.trend_scorer.build_matrix(keywords, days, history)
+        }
     
     def save_today_keywords(self, keyword_data):
-        """오늘 키워드 데이터 저장"""
+        """오늘 키워드 데이터 저장 (같은 날 재실행이면 덮어씀)"""
         try:
-            with open('yesterday_keywords.json', 'w', encoding='utf-8') as f:
-                json.dump(keyword_data, f, ensure_ascii=False, indent=2)
-                print(f"💾 오늘 키워드 저장 완료: {len(keyword_data)}개")
+            self.keyword_history.record(time.strftime('%Y-%m-%d'), keyword_data)
+            print(f"💾 오늘 키워드 저장 완료: {len(keyword_data)}개")
         except Exception as e:
             print(f"❌ 키워드 저장 실패: {e}")
     
-    def analyze_keyword_trends(self, today_keywords, yesterday_keywords):
-        """키워드 트렌드 분석 (NEW, HOT, RISING)"""
+    def analyze_keyword_trends(self, keyword_counts, keyword_history, display_keywords):
+        """키워드 트렌드 분석 (NEW, HOT, RISING) - 전체 키워드를 한 번에 점수화"""
         trends = {}
         
-        # 첫 실행인 경우 (어제 키워드 없음)
-        if not yesterday_keywords:
+        # 첫 실행인 경우 (이전 기록 없음)
+        if not keyword_history:
             print("📋 첫 실행입니다. 모든 키워드를 기본으로 표시합니다.")
-            for keyword, count in today_keywords.items():
+            for keyword in display_keywords:
                 trends[keyword] = {
-                    'count': count,
+                    'count': keyword_counts[keyword],
                     'tag': '',  # 첫 실행에는 태그 없음
                     'change': '0'
                 }
             return trends
         
-        for keyword, today_count in today_keywords.items():
-            yesterday_count = yesterday_keywords.get(keyword, 0)
-            
-            if yesterday_count == 0:
-                # 어제 없던 키워드
-                trends[keyword] = {
-                    'count': today_count,
-                    'tag': '🆕 NEW',
-                    'change': f'+{today_count}'
-                }
-            elif today_count >= yesterday_count * 2:
-                # 빈도가 2배 이상 증가
-                trends[keyword] = {
-                    'count': today_count,
-                    'tag': '🔥 HOT',
-                    'change': f'+{today_count - yesterday_count}'
-                }
-            elif today_count > yesterday_count:
-                # 점진적 상승
-                trends[keyword] = {
-                    'count': today_count,
-                    'tag': '📈 RISING',
-                    'change': f'+{today_count - yesterday_count}'
-                }
-            else:
-                # 변화 없거나 하락
-                trends[keyword] = {
-                    'count': today_count,
-                    'tag': '',
-                    'change': f'{today_count - yesterday_count}' if today_count != yesterday_count else '0'
-                }
+        # 오늘 빈도 벡터와 과거 행렬로 z-score / EWMA / 버스트 일괄 계산
+        keywords = list(keyword_counts)
+        today = [keyword_counts[keyword] for keyword in keywords]
+        metrics = self.trend_scorer.score(today, keyword_history['matrix'])
+        tags = self.trend_scorer.label(today, metrics)
+        
+        index = {keyword: i for i, keyword in enumerate(keywords)}
+        for keyword in display_keywords:
+            i = index[keyword]
+            # 변화량은 EWMA 기준값 대비
+            change = today[i] - int(round(metrics['ewma'][i]))
+            trends[keyword] = {
+                'count': today[i],
+                'tag': tags[i],
+                'change': f'+{change}' if change > 0 else f'{change}',
+                'z_score': round(float(metrics['z'][i]), 2)
+            }
         
         print(f"📊 트렌드 분석 완료:")
         new_count = len([k for k, v in trends.items() if v['tag'] == '🆕 NEW'])
@@ -308,69 +498,154 @@ class AINewsWebGenerator:
     def generate_keyword_chart_html(self, keyword_trends):
         """키워드 빈도 차트 HTML 생성 (트렌드 태그 포함)"""
         if not keyword_trends:
-            return """
-            <div class="keyword-chart">
-                <h3>📊 키워드 트렌드</h3>
-                <p>분석할 키워드가 충분하지 않습니다.</p>
-            </div>
-            """
+            return self.renderer.render('keyword_chart_empty.html', {})
         
         max_count = max([data['count'] for data in keyword_trends.values()]) if keyword_trends else 1
         
-        chart_html = """
-        <div class="keyword-chart">
-            <h3>📊 오늘의 AI 키워드 트렌드</h3>
-            <div class="chart-container">
-        """
-        
         # 키워드를 빈도순으로 정렬
         sorted_keywords = sorted(keyword_trends.items(), key=lambda x: x[1]['count'], reverse=True)
         
         # 각 키워드별 바 차트
-        for keyword, data in sorted_keywords:
-            count = data['count']
-            tag = data['tag']
-            change = data['change']
-            percentage = (count / max_count) * 100
-            
-            chart_html += f"""
-            <div class="keyword-bar">
-                <div class="keyword-label">
-                    {keyword}
-                    {f'<span class="trend-tag">{tag}</span>' if tag else ''}
-                </div>
-                <div class="bar-container">
-                    <div class="bar" style="width: {percentage}%"></div>
-                    <span class="count">{count}</span>
-                    {f'<span class="change">({change})</span>' if change != '0' else ''}
-                </div>
-            </div>
-            """
-        
-        chart_html += """
-            </div>
-        </div>
+        bars = self.renderer.render_each('keyword_bar.html', (
+            {
+                'keyword': keyword,
+                'trend_tag': f'<span class="trend-tag">{data["tag"]}</span>' if data['tag'] else '',
+                'percentage': (data['count'] / max_count) * 100,
+                'count': data['count'],
+                'change': f'<span class="change">({data["change"]})</span>' if data['change'] != '0' else ''
+            }
+            for keyword, data in sorted_keywords
+        ))
+        
+        return self.renderer.render('keyword_chart.html', {'bars': bars})
+    
+    def get_llm_summary(self, articles):
+        """LLM 제공자로 뉴스 요약 (일반용 + 임원용)
+
+        1단계 (map): 기사별 분석 (캐시에 없는 새 기사만 배치로 나눠 동시에 API 분석)
+        2단계 (reduce): 기사별 분석 결과를 모아 오늘의 요약 JSON 조립
         """
+        for provider in self.llm_chain:
+            print(f"📊 {provider.label}: {'사용 가능' if provider.available() else 'API 키 없음'}")
+        if not self.llm_chain:
+            print("❌ 사용할 LLM 제공자가 없습니다")
+            return None
         
-        return chart_html
+        # 같은 기사 묶음을 이미 요약했다면 API를 다시 호출하지 않음 (주 제공자 모델 기준)
+        cache_key = self.llm_cache.make_key(
+            self.summary_prompt_version, self.llm_chain[0].model, articles, self.llm_cache_scope
+        )
+        cached = self.llm_cache.get(cache_key)
+        if cached:
+            print("♻️ 캐시된 요약 사용 (API 호출 생략)")
+            return cached
+        
+        self.answered_providers = set()
+        extractions = self.extract_articles(articles)
+        if not any(extractions):
+            print("❌ 분석된 기사가 없습니다")
+            return None
+        
+        summary_data, overview_complete = self.assemble_digest(articles, extractions)
+        
+        # 모든 기사가 분석되고 전체 요약도 온전히 받은 경우만 캐시에 저장 (대체 문구는 재시도 때 다시 호출)
+        # 캐시 키는 주 제공자 모델 기준이므로 대체 제공자가 응답한 요약은 저장하지 않음
+        fallback_providers = self.answered_providers - {self.llm_chain[0].label}
+        if fallback_providers:
+            print(f"ℹ️ 대체 제공자 응답({', '.join(sorted(fallback_providers))})은 요약 캐시에 저장하지 않음")
+        elif all(extractions) and overview_complete:
+            self.llm_cache.put(cache_key, summary_data)
+        return summary_data
     
-    def get_gemini_summary(self, articles):
-        """Google Gemini API로 뉴스 요약 (일반용 + 임원용)"""
-        print(f"📊 Gemini API 키 확인: {'설정됨' if self.gemini_api_key else '설정 안됨'}")
+    def call_llm_json(self, prompt):
+        """LLM 스트리밍 호출 후 응답 JSON 객체 (실패시 None)
+
+        llm_chain 순서대로 시도하고, 재시도와 대기 시간을 모두 합쳐
+        llm_config['deadline']초를 넘기지 않는다. 응답이 중간에 끊기면 다음 제공자를
+        시도하되, 끝까지 완전한 응답이 없으면 끊기기 전까지 받은 필드를 돌려준다.
+        """
+        deadline = time.monotonic() + self.llm_config['deadline']
+        partial_data = None
+        partial_length = 0
+        
+        for provider in self.llm_chain:
+            if not provider.available():
+                continue
+            parser = PartialJSONParser()
+            provider.generate(prompt, deadline, parser)
+            
+            if parser.complete:
+                print("✅ JSON 파싱 성공!")
+                self.answered_providers.add(provider.label)
+                return parser.finish()
+            
+            parsed_data = parser.finish()
+            if parsed_data:
+                print(f"⚠️ 응답이 중간에 끊김 → 받은 필드만 보관: {', '.join(parsed_data)}")
+                # 여러 제공자가 끊겼으면 가장 많이 받은 응답을 보관
+                if partial_data is None or parser.parsed_end > partial_length:
+                    partial_data = parsed_data
+                    partial_length = parser.parsed_end
+                    partial_provider = provider
+            
+            if time.monotonic() >= deadline:
+                break
+        
+        if partial_data:
+            print("⚠️ 완전한 응답 없음 → 부분 결과 사용")
+            self.answered_providers.add(partial_provider.label)
+            return partial_data
+        
+        print("❌ 모든 LLM 호출 실패")
+        return None
     
-        if not self.gemini_api_key:
-            print("❌ GEMINI_API_KEY가 설정되지 않았습니다!")
-            return None
+    def extract_articles(self, articles):
+        """기사별 분석 결과 목록 (캐시 재사용, 새 기사만 API 호출)
+
+        map 단계: 새 기사를 프롬프트 예산에 맞는 배치로 나눠 동시에 분석한다.
+        동시 호출 수와 분당 호출 수는 제공자별 설정(llm_provider_config)으로 제한한다.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        extractions = [self.extraction_cache.get(article) for article in articles]
+        new_indices = [i for i, extraction in enumerate(extractions) if extraction is None]
+        print(f"🧾 기사별 분석: 캐시 {len(articles) - len(new_indices)}개, 새 기사 {len(new_indices)}개")
+        
+        if new_indices:
+            new_articles = [articles[i] for i in new_indices]
+            budget = self.prompt_config['extract_tokens'] - estimate_tokens(self.extract_prompt_template())
+            shards = self.prompt_builder.shard(new_articles, self.render_extract_article, budget)
+            # 동시 배치 수는 주 제공자의 동시 호출 한도에 맞춤
+            workers = max(1, min(self.llm_chain[0].concurrency, len(shards)))
+            print(f"🗂️ 새 기사 {len(new_articles)}개 → {len(shards)}개 배치로 분석 (동시 {workers}개)")
             
-        articles_text = ""
-        for i, article in enumerate(articles, 1):
-            articles_text += f"{i}. {article['title']}\n"
-            if article['summary']:
-                articles_text += f"   {article['summary'][:100]}...\n"
-            articles_text += f"   출처: {article['source']}\n\n"
-        
-        prompt = f"""
-다음 AI 뉴스들을 분석하여 JSON으로만 응답하세요. 모든 내용은 제공된 뉴스에서만 추출하고, 일반적이거나 추상적인 내용은 포함하지 마세요.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    (indices, executor.submit(self.extract_batch, [new_articles[i] for i in indices], text))
+                    for indices, text, used in shards
+                ]
+                for indices, future in futures:
+                    for i, extraction in zip(indices, future.result()):
+                        if extraction:
+                            article_index = new_indices[i]
+                            extractions[article_index] = extraction
+                            self.extraction_cache.put(articles[article_index], extraction)
+        
+        self.extraction_cache.save()
+        return extractions
+    
+    def render_extract_article(self, number, article):
+        """기사 분석 프롬프트의 기사 한 개 (HTML 제거, 요약은 토큰 예산만큼)"""
+        text = f"{number}. {self.prompt_builder.title(article)}\n"
+        summary = self.prompt_builder.summary(article)
+        if summary:
+            text += f"   {summary}\n"
+        return text + f"   출처: {article['source']}\n\n"
+    
+    def extract_prompt_template(self):
+        """기사 분석 프롬프트 틀 ({articles_text} 자리에 기사 목록)"""
+        return """
+다음 AI 뉴스 각각을 분석하여 JSON으로만 응답하세요. 모든 내용은 해당 뉴스에서만 추출하고, 일반적이거나 추상적인 내용은 포함하지 마세요.
 
 뉴스 목록:
 {articles_text}
@@ -379,98 +654,155 @@ class AINewsWebGenerator:
 1. 실제 뉴스에서 언급된 구체적인 내용만 사용
 2. 기업명, 제품명, 수치, 구체적 사건만 포함
 3. 일반론이나 뻔한 내용 금지
-4. 각 항목에 해당 뉴스 출처 표시
+4. 해당 내용이 없으면 빈 배열
+5. id는 뉴스 목록 번호 그대로
 
 응답 형식 (JSON만):
 {{
-  "today_summary": "오늘 뉴스의 핵심 내용 (2-3문장, 구체적 사실 기반)",
-  "key_trends": ["뉴스에서 실제 언급된 트렌드만 3개"],
-  "business_impact": {{
-    "opportunities": [
-      "실제 뉴스에서 언급된 구체적 비즈니스 기회 (기업명/제품명 포함)",
-      "수치나 구체적 사례가 있는 기회만"
-    ],
-    "risks": [
-      "뉴스에서 실제 보도된 위험 사건이나 이슈만",
-      "구체적 기업이나 사건 기반 위험요소만"
-    ],
-    "competitive_moves": [
-      "뉴스에서 언급된 실제 기업의 구체적 행동",
-      "기업명과 구체적 행동 내용 포함"
-    ]
-  }},
-  "focus_areas": [
-    "뉴스에서 실제 언급된 주목할 만한 기술이나 영역",
-    "구체적 기술 이름이나 시장 영역"
-  ],
-  "technology_watch": [
-    "뉴스에서 실제 언급된 기술명만",
-    "구체적 기술 이름이나 제품명"
+  "articles": [
+    {{
+      "id": 1,
+      "summary": "뉴스 핵심 내용 한 문장 (구체적 사실 기반)",
+      "entities": ["언급된 기업명이나 제품명"],
+      "opportunities": ["뉴스에서 언급된 구체적 비즈니스 기회 (기업명/제품명 포함)"],
+      "risks": ["뉴스에서 실제 보도된 위험 사건이나 이슈"],
+      "competitive_moves": ["기업명과 구체적 행동 내용"],
+      "focus_areas": ["주목할 만한 기술이나 시장 영역"],
+      "technologies": ["구체적 기술 이름이나 제품명"]
+    }}
   ]
 }}
 
 중요: 뉴스에 없는 내용은 절대 추가하지 마세요. 구체적 사실만 포함하세요.
         """
+    
+    def extract_batch(self, articles, articles_text):
+        """예산에 맞춘 기사 배치 하나를 한 번의 API 호출로 분석 (기사 순서대로, 실패한 기사는 None)"""
+        prompt = self.extract_prompt_template().format(articles_text=articles_text)
+        
+        parsed_data = self.call_llm_json(prompt)
+        results = [None] * len(articles)
+        if not parsed_data:
+            return results
+        
+        list_fields = ('entities', 'opportunities', 'risks', 'competitive_moves', 'focus_areas', 'technologies')
+        for item in parsed_data.get('articles', []):
+            # 응답이 끊겨 필드가 덜 채워진 마지막 기사는 분석하지 않은 것으로 둔다
+            if not all(field in item for field in list_fields):
+                continue
+            try:
+                index = int(item.get('id')) - 1
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < len(articles):
+                continue
+            extraction = {'summary': str(item.get('summary', '')).strip()}
+            for field in list_fields:
+                values = item.get(field) or []
+                extraction[field] = [str(value).strip() for value in values if str(value).strip()]
+            results[index] = extraction
+        return results
+    
+    def assemble_digest(self, articles, extractions):
+        """기사별 분석 결과 → (오늘의 요약 JSON, 전체 요약을 온전히 받았는지)"""
+        from collections import Counter
         
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash-latest:generateContent?key={self.gemini_api_key}"
-        
-        headers = {
-            'Content-Type': 'application/json',
+        analyzed = [(article, extraction) for article, extraction in zip(articles, extractions) if extraction]
+        default_data = self.get_default_summary_data()
+        
+        def collect(field, limit):
+            # 최신 기사 순서대로, 같은 문장은 한 번만 (출처 표시)
+            items = []
+            seen = set()
+            for article, extraction in analyzed:
+                for value in extraction.get(field, []):
+                    key = value.lower()
+                    if key not in seen:
+                        seen.add(key)
+                        items.append(f"{value} ({article['source']})")
+            return items[:limit]
+        
+        def rank(field, limit):
+            # 여러 기사에서 언급될수록 앞으로
+            counts = Counter()
+            display = {}
+            for _, extraction in analyzed:
+                for value in dict.fromkeys(extraction.get(field, [])):
+                    key = value.lower()
+                    counts[key] += 1
+                    display.setdefault(key, value)
+            return [display[key] for key, _ in counts.most_common(limit)]
+        
+        summary_data = {
+            "business_impact": {
+                "opportunities": collect('opportunities', 4) or default_data['business_impact']['opportunities'],
+                "risks": collect('risks', 4) or default_data['business_impact']['risks'],
+                "competitive_moves": collect('competitive_moves', 4) or default_data['business_impact']['competitive_moves']
+            },
+            "focus_areas": rank('focus_areas', 5) or default_data['focus_areas'],
+            "technology_watch": rank('technologies', 6) or default_data['technology_watch']
         }
         
-        data = {
-            "contents": [{
-                "parts": [{
-                    "text": prompt
-                }]
-            }]
-        }
+        overview = self.summarize_overview(analyzed)
+        if overview:
+            summary_data['today_summary'] = overview['today_summary']
+        else:
+            # 요약 호출 실패시 기사별 한 줄 요약으로 대체
+            summary_data['today_summary'] = ' '.join(
+                [extraction['summary'] for _, extraction in analyzed if extraction.get('summary')][:2]
+            ) or default_data['today_summary']
         
-        try:
-            print("🔄 Gemini API 호출 시작...")
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-            
-            print(f"📡 API 응답 상태: {response.status_code}")
-            
-            if response.status_code == 200:
-                print("✅ API 호출 성공!")
-                result = response.json()
-                
-                if 'candidates' in result and len(result['candidates']) > 0:
-                    content = result['candidates'][0]['content']['parts'][0]['text']
-                    print(f"📝 API 응답 내용 전체: {content}")
-                    
-                    try:
-                        # JSON 부분만 추출 시도
-                        start = content.find('{')
-                        end = content.rfind('}') + 1
-                        
-                        if start != -1 and end > start:
-                            json_part = content[start:end]
-                            print(f"🔍 추출된 JSON: {json_part}")
-                            parsed_data = json.loads(json_part)
-                            print("✅ JSON 파싱 성공!")
-                            return parsed_data
-                        else:
-                            print("❌ JSON 형식을 찾을 수 없습니다")
-                            return self.get_default_summary_data()
-                            
-                    except Exception as e:
-                        print(f"❌ JSON 파싱 실패: {e}")
-                        print(f"🔍 원본 응답: {content}")
-                        return self.get_default_summary_data()
-                else:
-                    print("❌ API 응답에 content가 없습니다")
-                    print(f"🔍 전체 응답: {result}")
-                    return None
-            else:
-                print(f"❌ API 호출 실패: {response.status_code}")
-                print(f"🔍 응답 내용: {response.text}")
-                return None
+        if overview and overview['key_trends']:
+            summary_data['key_trends'] = overview['key_trends']
+        else:
+            # 응답이 없거나 key_trends 전에 끊긴 경우 주목 영역으로 대체
+            summary_data['key_trends'] = summary_data['focus_areas'][:3]
+        
+        overview_complete = bool(overview and overview['key_trends'])
+        return summary_data, overview_complete
+    
+    def summarize_overview(self, analyzed):
+        """기사별 한 줄 요약만으로 오늘의 요약 + 주요 트렌드 생성 (reduce 단계, 짧은 프롬프트)
 
-        except Exception as e:
-            print(f"❌ Gemini API 오류: {e}")
+        배치별 분석 결과를 한 번에 모으므로 기사가 많으면 overview_tokens 예산 안에서
+        묶인 기사 수가 많고 최신인 요약부터 넣는다.
+        """
+        # 기사별 분석 요약을 summary 자리에 넣어 같은 예산 규칙으로 채움
+        items = [
+            dict(article, summary=extraction['summary'])
+            for article, extraction in analyzed if extraction.get('summary')
+        ]
+        if not items:
+            return None
+        
+        def render(number, item):
+            return f"- {self.prompt_builder.summary(item)} (출처: {item['source']})\n"
+        
+        template = """
+다음은 오늘 AI 뉴스의 기사별 핵심 요약입니다. JSON으로만 응답하세요.
+
+{summaries_text}
+응답 형식 (JSON만):
+{{
+  "today_summary": "오늘 뉴스의 핵심 내용 (2-3문장, 구체적 사실 기반)",
+  "key_trends": ["요약에서 실제 언급된 트렌드만 3개"]
+}}
+
+중요: 요약에 없는 내용은 절대 추가하지 마세요.
+        """
+        
+        budget = self.prompt_config['overview_tokens'] - estimate_tokens(template)
+        selected, summaries_text, used = self.prompt_builder.pack(items, render, budget)
+        print(f"✂️ 요약 프롬프트: {len(selected)}/{len(items)}개 기사, 약 {used}토큰 (예산 {budget})")
+        prompt = template.format(summaries_text=summaries_text)
+        
+        parsed_data = self.call_llm_json(prompt)
+        if not parsed_data or not parsed_data.get('today_summary'):
             return None
+        return {
+            'today_summary': str(parsed_data['today_summary']),
+            'key_trends': [str(trend) for trend in parsed_data.get('key_trends') or []][:3]
+        }
     
     def get_default_summary_data(self):
         """기본 요약 데이터 (API 실패시 사용)"""
@@ -489,699 +821,131 @@ class AINewsWebGenerator:
     def generate_executive_section_html(self, summary_data):
         """임원용 섹션 HTML 생성"""
         business_impact = summary_data.get('business_impact', {})
-        opportunities = business_impact.get('opportunities', [])
-        risks = business_impact.get('risks', [])
-        competitive_moves = business_impact.get('competitive_moves', [])
-        focus_areas = summary_data.get('focus_areas', [])
-        technology_watch = summary_data.get('technology_watch', [])
-        
-        executive_html = f"""
-        <div class="executive-section">
-            <div class="executive-header">
-                <h2>📊 보고</h2>
-            </div>
-            
-            <div class="impact-grid">
-                <div class="impact-card opportunities">
-                    <h3>🚀 비즈니스 기회</h3>
-                    <ul>
-                        {''.join([f'<li>{opp}</li>' for opp in opportunities])}
-                    </ul>
-                </div>
-                
-                <div class="impact-card risks">
-                    <h3>⚠️ 위험 요소</h3>
-                    <ul>
-                        {''.join([f'<li>{risk}</li>' for risk in risks])}
-                    </ul>
-                </div>
-                
-                <div class="impact-card competitive">
-                    <h3>🏢 경쟁사 동향</h3>
-                    <ul>
-                        {''.join([f'<li>{move}</li>' for move in competitive_moves])}
-                    </ul>
-                </div>
-            </div>
-            
-            <div class="focus-areas">
-                <div class="focus-card">
-                    <h3>📈 주목 영역</h3>
-                    <div class="focus-tags">
-                        {''.join([f'<span class="focus-tag investment">{focus}</span>' for focus in focus_areas])}
-                    </div>
-                </div>
-                
-                <div class="focus-card">
-                    <h3>🔬 기술 모니터링</h3>
-                    <div class="focus-tags">
-                        {''.join([f'<span class="focus-tag technology">{tech}</span>' for tech in technology_watch])}
-                    </div>
-                </div>
-            </div>
-        </div>
-        """
-        
-        return executive_html
-    
-    def generate_executive_styles(self):
-        """임원용 섹션 CSS 스타일"""
-        return """
-        .executive-section {
-            background: #f8f9fa;
-            padding: 30px;
-            margin-bottom: 20px;
-            border-left: 5px solid #dc3545;
-        }
-        
-        .executive-header h2 {
-            color: #dc3545;
-            font-size: 1.8rem;
-            margin-bottom: 20px;
-            font-weight: 700;
-        }
-        
-        .executive-summary-card {
-            background: white;
-            border-radius: 10px;
-            padding: 25px;
-            margin-bottom: 25px;
-            border-left: 4px solid #dc3545;
-            box-shadow: 0 5px 15px rgba(220, 53, 69, 0.1);
-        }
-        
-        .executive-summary-card h3 {
-            color: #dc3545;
-            margin-bottom: 15px;
-            font-size: 1.2rem;
-        }
-        
-        .executive-summary-text {
-            font-size: 1.1rem;
-            line-height: 1.6;
-            color: #2c3e50;
-            font-weight: 500;
-        }
-        
-        .impact-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-        
-        .impact-card {
-            background: white;
-            border-radius: 10px;
-            padding: 20px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        }
-        
-        .impact-card.opportunities {
-            border-left: 4px solid #28a745;
-        }
-        
-        .impact-card.risks {
-            border-left: 4px solid #ffc107;
-        }
-        
-        .impact-card.competitive {
-            border-left: 4px solid #6f42c1;
-        }
-        
-        .impact-card h3 {
-            margin-bottom: 15px;
-            font-size: 1.1rem;
-        }
-        
-        .opportunities h3 {
-            color: #28a745;
-        }
-        
-        .risks h3 {
-            color: #ffc107;
-        }
-        
-        .competitive h3 {
-            color: #6f42c1;
-        }
-        
-        .impact-card ul {
-            list-style: none;
-            padding: 0;
-        }
-        
-        .impact-card li {
-            padding: 8px 0;
-            border-bottom: 1px solid #f1f3f4;
-            color: #495057;
-            font-size: 0.95rem;
-        }
-        
-        .impact-card li:last-child {
-            border-bottom: none;
-        }
-        
-        .recommendations-section {
-            margin-bottom: 30px;
-        }
-        
-        .recommendations-section h3 {
-            color: #dc3545;
-            margin-bottom: 20px;
-            font-size: 1.3rem;
-        }
-        
-        .recommendations-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 15px;
-        }
-        
-        .recommendation-card {
-            background: white;
-            border-radius: 10px;
-            padding: 20px;
-            box-shadow: 0 3px 10px rgba(0,0,0,0.08);
-            position: relative;
-        }
-        
-        .recommendation-card.high {
-            border-left: 4px solid #dc3545;
-        }
-        
-        .recommendation-card.medium {
-            border-left: 4px solid #ffc107;
-        }
-        
-        .recommendation-card.low {
-            border-left: 4px solid #6c757d;
-        }
-        
-        .rec-priority {
-            position: absolute;
-            top: 10px;
-            right: 15px;
-            padding: 4px 10px;
-            border-radius: 15px;
-            font-size: 0.75rem;
-            font-weight: 600;
-        }
-        
-        .recommendation-card.high .rec-priority {
-            background: #dc3545;
-            color: white;
-        }
-        
-        .recommendation-card.medium .rec-priority {
-            background: #ffc107;
-            color: black;
-        }
-        
-        .recommendation-card.low .rec-priority {
-            background: #6c757d;
-            color: white;
-        }
-        
-        .rec-action {
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 10px;
-            padding-right: 60px;
-            font-size: 1rem;
-        }
-        
-        .rec-timeline {
-            color: #6c757d;
-            font-size: 0.9rem;
-        }
-        
-        .focus-areas {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 20px;
-        }
-        
-        .focus-card {
-            background: white;
-            border-radius: 10px;
-            padding: 20px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        }
-        
-        .focus-card h3 {
-            color: #dc3545;
-            margin-bottom: 15px;
-            font-size: 1.1rem;
-        }
-        
-        .focus-tags {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-        }
         
-        .focus-tag {
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: 500;
-        }
-        
-        .focus-tag.investment {
-            background: #e8f5e8;
-            color: #2e7d32;
-            border: 1px solid #4caf50;
-        }
-        
-        .focus-tag.technology {
-            background: #e3f2fd;
-            color: #1976d2;
-            border: 1px solid #2196f3;
-        }
+        def items(values, template):
+            return ''.join([template.format(value) for value in values])
         
-        @media (max-width: 768px) {
-            .executive-section {
-                padding: 20px;
-            }
-            
-            .impact-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .recommendations-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .focus-areas {
-                grid-template-columns: 1fr;
-            }
+        return self.renderer.render('executive_section.html', {
+            'opportunities': items(business_impact.get('opportunities', []), '<li>{}</li>'),
+            'risks': items(business_impact.get('risks', []), '<li>{}</li>'),
+            'competitive_moves': items(business_impact.get('competitive_moves', []), '<li>{}</li>'),
+            'focus_areas': items(summary_data.get('focus_areas', []), '<span class="focus-tag investment">{}</span>'),
+            'technology_watch': items(summary_data.get('technology_watch', []), '<span class="focus-tag technology">{}</span>')
+        })
+    
+    def generate_related_sources_html(self, article):
+        """같은 소식을 다룬 다른 매체 링크 HTML"""
+        related = article.get('related_sources')
+        if not related:
+            return ''
+        links = ', '.join([
+            f'<a href="{item["link"]}" target="_blank">{item["source"]}</a>' for item in related
+        ])
+        return f'<p class="news-related">🔗 같은 소식: {links}</p>'
+    
+    def page_snapshot(self, articles, summary_data, keyword_trends=None):
+        """페이지를 다시 그리는 데 필요한 입력만 추린 하루치 데이터 (아카이브 저장/빌드 버전 계산용)"""
+        return {
+            'articles': [
+                {
+                    'source': article.get('source', 'AI News'),
+                    'published': (article.get('published') or '')[:16],
+                    'title': article['title'],
+                    'summary': article['summary'][:200],
+                    'link': article['link'],
+                    'related_sources': article.get('related_sources') or []
+                }
+                for article in articles
+            ],
+            'summary_data': summary_data,
+            'keyword_trends': keyword_trends or {}
         }
-        """
     
-    def generate_html(self, articles, summary_data, keyword_trends=None):
-        """HTML 웹페이지 생성 (임원용 섹션 포함)"""
-        current_time = time.strftime('%Y년 %m월 %d일 %H시 %M분')
-        
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI 뉴스 데일리 | {time.strftime('%Y-%m-%d')}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-            line-height: 1.6;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            font-weight: 700;
-        }}
-        
-        .header p {{
-            font-size: 1.2rem;
-            opacity: 0.9;
-        }}
-        
-        .update-time {{
-            background: #f8f9fa;
-            padding: 15px;
-            text-align: center;
-            border-bottom: 1px solid #e9ecef;
-            font-size: 0.9rem;
-            color: #6c757d;
-        }}
-        
-        .summary-section {{
-            padding: 30px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .summary-card {{
-            background: white;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 20px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        }}
-        
-        .summary-card h3 {{
-            color: #4facfe;
-            margin-bottom: 15px;
-            font-size: 1.3rem;
-        }}
-        
-        .trends-list {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-top: 10px;
-        }}
-        
-        .trend-tag {{
-            background: #e3f2fd;
-            color: #1976d2;
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: 500;
-        }}
-        
-        .keyword-chart {{
-            background: white;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 20px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        }}
-        
-        .keyword-chart h3 {{
-            color: #4facfe;
-            margin-bottom: 20px;
-            font-size: 1.3rem;
-        }}
-        
-        .chart-container {{
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-        }}
-        
-        .keyword-bar {{
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }}
-        
-        .keyword-label {{
-            min-width: 180px;
-            font-weight: 500;
-            color: #2c3e50;
-            font-size: 0.9rem;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .trend-tag {{
-            font-size: 0.7rem;
-            padding: 2px 6px;
-            border-radius: 8px;
-            background: #f0f8ff;
-            border: 1px solid #4facfe;
-            color: #4facfe;
-            font-weight: 600;
-        }}
-        
-        .bar-container {{
-            flex: 1;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .bar {{
-            height: 25px;
-            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-            border-radius: 12px;
-            min-width: 20px;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .bar:hover {{
-            transform: scaleY(1.1);
-            box-shadow: 0 3px 10px rgba(79, 172, 254, 0.3);
-        }}
-        
-        .bar::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
-            animation: shine 2s infinite;
-        }}
-        
-        @keyframes shine {{
-            0% {{ left: -100%; }}
-            100% {{ left: 100%; }}
-        }}
-        
-        .count {{
-            font-weight: 600;
-            color: #4facfe;
-            min-width: 30px;
-            text-align: center;
-            font-size: 0.9rem;
-        }}
-        
-        .change {{
-            font-size: 0.8rem;
-            color: #666;
-            min-width: 40px;
-            text-align: right;
-        }}
-        
-        {self.generate_executive_styles()}
-        
-        .news-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 20px;
-            padding: 30px;
-        }}
-        
-        .news-card {{
-            background: white;
-            border-radius: 10px;
-            padding: 20px;
-            border: 1px solid #e9ecef;
-            transition: all 0.3s ease;
-            position: relative;
-        }}
-        
-        .news-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 10px 25px rgba(0,0,0,0.15);
-        }}
-        
-        .news-card h3 {{
-            color: #2c3e50;
-            margin-bottom: 15px;
-            font-size: 1.2rem;
-            line-height: 1.4;
-        }}
-        
-        .news-card p {{
-            color: #7f8c8d;
-            margin-bottom: 15px;
-            font-size: 0.95rem;
-        }}
-        
-        .news-meta {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }}
-        
-        .news-source {{
-            background: #e8f5e8;
-            color: #2e7d32;
-            padding: 5px 10px;
-            border-radius: 5px;
-            font-size: 0.8rem;
-            font-weight: 500;
-        }}
-        
-        .news-date {{
-            color: #95a5a6;
-            font-size: 0.8rem;
-        }}
-        
-        .read-more {{
-            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-            color: white;
-            padding: 10px 20px;
-            border-radius: 25px;
-            text-decoration: none;
-            font-weight: 500;
-            transition: all 0.3s ease;
-            display: inline-block;
-        }}
-        
-        .read-more:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(79, 172, 254, 0.4);
-        }}
-        
-        .footer {{
-            background: #2c3e50;
-            color: white;
-            padding: 20px;
-            text-align: center;
-        }}
-        
-        .refresh-btn {{
-            position: fixed;
-            bottom: 30px;
-            right: 30px;
-            background: #4facfe;
-            color: white;
-            border: none;
-            border-radius: 50%;
-            width: 60px;
-            height: 60px;
-            font-size: 1.5rem;
-            cursor: pointer;
-            box-shadow: 0 5px 15px rgba(79, 172, 254, 0.4);
-            transition: all 0.3s ease;
-        }}
-        
-        .refresh-btn:hover {{
-            transform: scale(1.1);
-        }}
-        
-        @media (max-width: 768px) {{
-            .news-grid {{
-                grid-template-columns: 1fr;
-                padding: 20px;
-            }}
-            
-            .header h1 {{
-                font-size: 2rem;
-            }}
-            
-            .summary-section {{
-                padding: 20px;
-            }}
-            
-            .keyword-label {{
-                min-width: 140px;
-                font-size: 0.8rem;
-            }}
-            
-            .bar {{
-                height: 20px;
-            }}
-            
-            .trend-tag {{
-                font-size: 0.6rem;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🤖 AI 뉴스 데일리</h1>
-            <p>오늘의 인공지능 뉴스를 한눈에</p>
-        </div>
-        
-        <div class="update-time">
-            마지막 업데이트: {current_time}
-        </div>
-        
-        <div class="summary-section">
-            <div class="summary-card">
-                <h3>📈 오늘의 한줄 요약</h3>
-                <p>{summary_data.get('today_summary', '요약 준비 중입니다.')}</p>
-            </div>
-            
-            {self.generate_keyword_chart_html(keyword_trends) if keyword_trends else ''}
-            
-            <div class="summary-card">
-                <h3>🔥 주요 트렌드</h3>
-                <div class="trends-list">
-                    {''.join([f'<span class="trend-tag">{trend}</span>' for trend in summary_data.get('key_trends', ['분석 중'])])}
-                </div>
-            </div>
-        </div>
-        
-        {self.generate_executive_section_html(summary_data)}
-        
-        <div class="news-grid">
+    def build_version(self, snapshot, assets=None):
+        """페이지에 들어가는 내용(날짜/시각 제외)의 해시 → 빌드 버전 (열린 탭의 새로고침 판단용)"""
+        return content_hash([snapshot, assets])[:12]
+    
+    def iter_html(self, articles, summary_data, keyword_trends=None, build_version='', root='', generated_at=None):
+        """HTML 웹페이지를 조각(머리말, 요약, 임원용 섹션, 뉴스 카드 하나씩) 단위로 내보내기
+
+        뉴스 카드는 기사 하나씩 만들어 바로 내보내므로 기사 수와 상관없이 메모리 사용이 일정하다.
+        root는 사이트 최상위까지의 상대 경로(아카이브 페이지는 '../'), generated_at은 생성 시각(초)이다.
         """
-        
-        # 뉴스 카드들 추가
-        for article in articles:
-            # 발행일 포맷팅
-            published_date = ""
-            if article.get('published'):
-                published_date = article['published'][:16]  # 앞의 16글자만 사용
-            html_content += f"""
-            <div class="news-card">
-                <div class="news-meta">
-                    <span class="news-source">{article.get('source', 'AI News')}</span>
-                    <span class="news-date">{published_date}</span>
-                </div>
-                <h3>{article['title']}</h3>
-                <p>{article['summary'][:200]}...</p>
-                <a href="{article['link']}" target="_blank" class="read-more">자세히 읽기</a>
-            </div>
-            """
-        
-        html_content += """
-        </div>
-        
-        <div class="footer">
-            <p>🔄 매일 오전 10시 자동 업데이트 | Made with Gemini AI</p>
-        </div>
-    </div>
+        generated = time.localtime(generated_at)
+        news_cards = self.renderer.iter_render_each('news_card.html', (
+            {
+                'source': article.get('source', 'AI News'),
+                # 발행일은 앞의 16글자만 사용
+                'published_date': article['published'][:16] if article.get('published') else '',
+                'title': article['title'],
+                'summary': article['summary'][:200],
+                'related_sources': self.generate_related_sources_html(article),
+                'link': article['link']
+            }
+            for article in articles
+        ))
+        
+        return self.renderer.iter_render('page.html', {
+            # 날짜/시각은 내용 해시에서 제외 (바뀐 뉴스가 없으면 다시 배포하지 않도록)
+            'page_date': Volatile(time.strftime('%Y-%m-%d', generated)),
+            'update_time': Volatile(time.strftime('%Y년 %m월 %d일 %H시 %M분', generated)),
+            'build_version': build_version,
+            'root': root,
+            'style_css': root + self.asset_builder.build('style.css'),
+            'app_js': root + self.asset_builder.build('app.js'),
+            'today_summary': summary_data.get('today_summary', '요약 준비 중입니다.'),
+            'keyword_chart': self.generate_keyword_chart_html(keyword_trends) if keyword_trends else '',
+            'key_trends': ''.join([
+                f'<span class="trend-tag">{trend}</span>' for trend in summary_data.get('key_trends', ['분석 중'])
+            ]),
+            'executive_section': self.generate_executive_section_html(summary_data),
+            'news_cards': news_cards
+        })
+    
+    def generate_html(self, articles, summary_data, keyword_trends=None, build_version=''):
+        """HTML 웹페이지 문자열 생성 (임원용 섹션 포함, CSS/JS는 assets/ 의 지문 파일)"""
+        return ''.join(self.iter_html(articles, summary_data, keyword_trends, build_version))
     
-    <button class="refresh-btn" onclick="location.reload()">🔄</button>
+    def render_archive_day(self, data, entry):
+        """아카이브 날짜 페이지 조각 (빌드 버전이 없으므로 자동 새로고침하지 않음)"""
+        return self.iter_html(
+            data['articles'], data['summary_data'], data['keyword_trends'],
+            root='../', generated_at=entry.get('generated_at')
+        )
     
-    <script>
-        // 자동 새로고침 (30분마다)
-        setTimeout(function() {
-            location.reload();
-        }, 30 * 60 * 1000);
-    </script>
-</body>
-</html>
+    def render_archive_index(self, entries):
+        """아카이브 목록 페이지 조각 (최근 날짜부터)"""
+        return self.renderer.iter_render('archive_index.html', {
+            'style_css': '../' + self.asset_builder.build('style.css'),
+            'entries': self.renderer.iter_render_each('archive_entry.html', entries)
+        })
+    
+    def site_build_version(self):
+        """아카이브 페이지 전체에 공통인 입력 (렌더링 코드 버전 + 템플릿 + 자산 파일 이름)"""
+        return [
+            self.site_version,
+            self.renderer.fingerprint(),
+            self.asset_builder.build('style.css'),
+            self.asset_builder.build('app.js')
+        ]
+    
+    def save_to_file(self, html_content, path='index.html'):
+        """HTML 파일로 저장 (문자열 또는 조각을 내보내는 반복 가능 객체)
+
+        임시 파일에 버퍼링해 쓰고 fsync 후 rename하므로 중간에 끊겨도 잘린 페이지가 남지 않는다.
+        시각을 뺀 내용이 지난번과 같으면 기존 파일을 그대로 둔다.
         """
-        
-        return html_content
+        if self.output_writer.write(path, html_content):
+            print(f"{path} 파일 생성 완료!")
     
-    def save_to_file(self, html_content):
-        """HTML 파일로 저장"""
-        with open('index.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print("index.html 파일 생성 완료!")
+    def report_llm_usage(self):
+        """제공자별 호출 수/토큰/비용 출력"""
+        reports = [provider.report() for provider in self.llm_chain]
+        for report in reports:
+            if report:
+                print(f"💰 {report}")
+        if any(reports):
+            print(f"💰 LLM 비용 합계: 약 ${sum(provider.cost() for provider in self.llm_chain):.4f}")
     
     def run(self):
         """메인 실행 함수"""
@@ -1199,28 +963,45 @@ class AINewsWebGenerator:
         
         # 2. 최적화된 키워드 빈도 분석
         print("🔍 키워드 트렌드 분석 중...")
-        today_keywords = self.analyze_keywords_optimal(articles)
+        keyword_counts = self.count_keywords(articles)
+        today_keywords = self.analyze_keywords_optimal(articles, keyword_counts)
         
-        # 3. 어제 키워드 불러오고 트렌드 분석
-        yesterday_keywords = self.load_yesterday_keywords()
-        keyword_trends = self.analyze_keyword_trends(today_keywords, yesterday_keywords)
+        # 3. 최근 키워드 기록 불러오고 트렌드 분석
+        keyword_history = self.load_keyword_history(list(keyword_counts))
+        keyword_trends = self.analyze_keyword_trends(keyword_counts, keyword_history, list(today_keywords))
         
-        # 4. 오늘 키워드 저장 (내일을 위해)
-        self.save_today_keywords(today_keywords)
+        # 4. 오늘 키워드 전체 저장 (다음 실행을 위해)
+        self.save_today_keywords(keyword_counts)
         
-        # 5. Gemini 요약 (일반용 + 임원용)
-        print("🤖 Gemini AI 분석 중...")
-        summary_data = self.get_gemini_summary(articles)
+        # 5. LLM 요약 (일반용 + 임원용)
+        print("🤖 AI 분석 중...")
+        summary_data = self.get_llm_summary(self.digest_articles or articles)
+        self.report_llm_usage()
         
         if not summary_data:
             summary_data = self.get_default_summary_data()
         
-        # 6. HTML 생성 (임원용 섹션 포함)
+        # 6. HTML 생성 + 파일 저장 (임원용 섹션 포함, 렌더링 조각을 바로 파일로 기록)
         print("🎨 웹페이지 생성 중...")
-        html_content = self.generate_html(articles, summary_data, keyword_trends)
-        
-        # 7. 파일 저장
-        self.save_to_file(html_content)
+        generated_at = time.time()
+        snapshot = self.page_snapshot(articles, summary_data, keyword_trends)
+        assets = [self.asset_builder.build('style.css'), self.asset_builder.build('app.js')]
+        build_version = self.build_version(snapshot, assets)
+        self.save_to_file(self.iter_html(
+            articles, summary_data, keyword_trends, build_version, generated_at=generated_at
+        ))
+        # 열린 탭은 30분마다 이 파일만 확인해 버전이 바뀌었을 때만 새로고침
+        self.asset_builder.write_version(build_version)
+        
+        # 7. 날짜별 아카이브 (오늘 입력 저장 후 입력이 바뀐 페이지만 다시 빌드)
+        self.site_builder.add_day(
+            time.strftime('%Y-%m-%d', time.localtime(generated_at)),
+            snapshot,
+            summary_data.get('today_summary', ''),
+            generated_at
+        )
+        self.site_builder.build(self.site_build_version())
+        self.output_writer.finish()
         
         print("✅ 웹페이지 생성 완료!")
         print("📱 브라우저에서 index.html 파일을 열어보세요!")
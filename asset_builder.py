@@ -0,0 +1,39 @@
+# 정적 자산(CSS/JS) 지문 파일 생성 + 빌드 버전 매니페스트 #
+import hashlib
+import json
+import os
+
+
+class AssetBuilder:
+    """static/ 의 CSS/JS를 내용 해시가 붙은 파일 이름(style.<해시>.css)으로 내보내는 빌더
+
+    내용이 바뀌면 파일 이름도 바뀌므로 브라우저/CDN이 오래 캐시해도 안전하고,
+    HTML에는 <link>/<script> 한 줄만 남는다. 기록은 OutputWriter를 거쳐 원자적으로 한다.
+    """
+
+    def __init__(self, writer, source_dir='static', output_dir='assets', digest_length=10):
+        self.writer = writer
+        self.source_dir = source_dir
+        self.output_dir = output_dir
+        self.digest_length = digest_length
+        self.built = {}
+
+    def fingerprint(self, content):
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:self.digest_length]
+
+    def build(self, name):
+        """static/<name> → assets/<이름>.<해시><확장자> 로 기록하고 사이트 기준 경로 반환 (실행당 한 번)"""
+        url = self.built.get(name)
+        if url is None:
+            with open(os.path.join(self.source_dir, name), 'r', encoding='utf-8') as f:
+                content = f.read()
+            stem, ext = os.path.splitext(name)
+            url = f"{self.output_dir}/{stem}.{self.fingerprint(content)}{ext}"
+            os.makedirs(self.output_dir, exist_ok=True)
+            self.writer.write(url, content)
+            self.built[name] = url
+        return url
+
+    def write_version(self, version, path='version.json'):
+        """열린 페이지가 주기적으로 확인하는 빌드 버전 매니페스트 기록"""
+        self.writer.write(path, json.dumps({'version': version}))
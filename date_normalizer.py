@@ -0,0 +1,138 @@
+# 기사 날짜 정규화 (RFC 822 / ISO 8601 빠른 경로 + dateutil 대체) #
+import re
+from datetime import datetime, timedelta, timezone
+
+from dateutil import parser as dateutil_parser
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# RFC 822에서 쓰이는 시간대 약어 (시간 단위 오프셋)
+TZ_NAMES = {
+    'gmt': 0, 'ut': 0, 'utc': 0, 'z': 0,
+    'est': -5, 'edt': -4, 'cst': -6, 'cdt': -5,
+    'mst': -7, 'mdt': -6, 'pst': -8, 'pdt': -7,
+    'kst': 9, 'jst': 9, 'cet': 1, 'cest': 2, 'bst': 1
+}
+
+# 예: "Fri, 17 Oct 2026 09:30:00 +0000", "17 Oct 2026 09:30 GMT"
+RFC822_RE = re.compile(
+    r'^(?:[a-z]{3},?\s*)?(\d{1,2})\s+([a-z]{3})[a-z]*\s+(\d{2,4})\s+'
+    r'(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([a-z]+|[+-]\d{4})?$',
+    re.IGNORECASE
+)
+
+# 예: "2026-10-17T09:30:00Z", "2026-10-17T09:30:00.123+09:00", "2026-10-17"
+ISO8601_RE = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?)?\s*'
+    r'(z|[+-]\d{2}:?\d{2})?$',
+    re.IGNORECASE
+)
+
+
+def parse_offset(value):
+    """'+0900', '+09:00', 'GMT', 'PST' 같은 시간대 표기를 tzinfo로 (없으면 UTC)"""
+    if not value:
+        return timezone.utc
+    value = value.lower()
+    if value in TZ_NAMES:
+        return timezone(timedelta(hours=TZ_NAMES[value]))
+    if value[0] in '+-':
+        digits = value[1:].replace(':', '')
+        if len(digits) == 4 and digits.isdigit():
+            offset = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+            return timezone(-offset if value[0] == '-' else offset)
+    return None
+
+
+def parse_rfc822(value):
+    match = RFC822_RE.match(value)
+    if not match:
+        return None
+    day, month, year, hour, minute, second, tz = match.groups()
+    month = MONTHS.get(month.lower())
+    tzinfo = parse_offset(tz)
+    if not month or tzinfo is None:
+        return None
+    year = int(year)
+    if year < 100:
+        year += 2000
+    return datetime(year, month, int(day), int(hour), int(minute), int(second or 0), tzinfo=tzinfo)
+
+
+def parse_iso8601(value):
+    match = ISO8601_RE.match(value)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, tz = match.groups()
+    tzinfo = parse_offset(tz)
+    if tzinfo is None:
+        return None
+    return datetime(
+        int(year), int(month), int(day),
+        int(hour or 0), int(minute or 0), int(second or 0),
+        tzinfo=tzinfo
+    )
+
+
+def parse_fallback(value):
+    date = dateutil_parser.parse(value)
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date
+
+
+class DateNormalizer:
+    """기사 날짜를 UTC 기준 aware datetime으로 통일
+
+    소스마다 마지막으로 성공한 형식을 기억해 두고 그 형식부터 시도하며,
+    미리 컴파일된 형식이 모두 실패할 때만 dateutil을 사용한다.
+    """
+
+    FAST_PARSERS = (('rfc822', parse_rfc822), ('iso8601', parse_iso8601))
+
+    def __init__(self):
+        self.source_formats = {}
+        self.fallback_count = 0
+
+    def normalize(self, value, source=None):
+        """날짜 문자열 → UTC datetime (실패시 None)"""
+        if not value:
+            return None
+        value = value.strip()
+
+        preferred = self.source_formats.get(source)
+        parsers = sorted(self.FAST_PARSERS, key=lambda item: item[0] != preferred)
+        for name, parse in parsers:
+            try:
+                date = parse(value)
+            except ValueError:
+                date = None
+            if date:
+                self.source_formats[source] = name
+                return date.astimezone(timezone.utc)
+
+        try:
+            date = parse_fallback(value)
+        except (ValueError, OverflowError):
+            return None
+        self.fallback_count += 1
+        return date.astimezone(timezone.utc)
+
+    def from_struct(self, struct):
+        """feedparser의 *_parsed (UTC struct_time) → UTC datetime"""
+        try:
+            return datetime(*struct[:6], tzinfo=timezone.utc)
+        except (TypeError, ValueError):
+            return None
+
+    def from_entry(self, entry, source=None):
+        """기사 하나의 발행 시각 (published_parsed 우선, 없으면 문자열 파싱)"""
+        if entry.get('published_parsed'):
+            date = self.from_struct(entry['published_parsed'])
+            if date:
+                return date
+        return self.normalize(entry.get('published'), source)
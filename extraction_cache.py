@@ -0,0 +1,70 @@
+# 기사별 LLM 분석 결과 캐시 #
+import hashlib
+import json
+import time
+
+
+class ArticleExtractionCache:
+    """기사 링크 + 내용 해시 기준으로 기사별 분석 결과(기업/기회/위험 등)를 저장
+
+    48시간 창 안의 기사는 대부분 전날에도 분석했으므로, 다음 실행에서는 새 기사만 LLM에 보낸다.
+    prompt_version이 바뀌면 기존 결과는 모두 무효가 된다. scope는 스텁 서버처럼 실제 API가 아닌
+    응답을 구분하는 값으로, 다르면 서로의 결과를 쓰지 않는다.
+    """
+
+    def __init__(self, path='article_extractions.json', prompt_version='extract-v1', retention_days=7, scope=''):
+        self.path = path
+        self.prompt_version = prompt_version
+        self.scope = scope
+        self.retention_days = retention_days
+        self.data = self.load()
+
+    def load(self):
+        """캐시 파일 불러오기"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                print(f"📋 기사 분석 캐시 불러옴: {len(data)}개 기사")
+                return data
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"❌ 기사 분석 캐시 불러오기 실패: {e}")
+            return {}
+
+    def save(self):
+        """오래된 기사를 정리하고 저장"""
+        expire_before = time.time() - self.retention_days * 24 * 3600
+        self.data = {
+            link: item for link, item in self.data.items()
+            if item.get('last_seen', 0) >= expire_before
+        }
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"❌ 기사 분석 캐시 저장 실패: {e}")
+
+    def key(self, article):
+        return article.get('link') or article.get('title', '')
+
+    def content_hash(self, article):
+        content = f"{self.prompt_version}\n{article.get('title', '')}\n{article.get('summary', '')}"
+        if self.scope:
+            content += f"\n{self.scope}"
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def get(self, article):
+        """캐시된 분석 결과 (없거나 내용이 바뀌었으면 None)"""
+        item = self.data.get(self.key(article))
+        if not item or item.get('hash') != self.content_hash(article):
+            return None
+        item['last_seen'] = time.time()
+        return item['extraction']
+
+    def put(self, article, extraction):
+        self.data[self.key(article)] = {
+            'hash': self.content_hash(article),
+            'extraction': extraction,
+            'last_seen': time.time()
+        }
@@ -0,0 +1,203 @@
+# RSS 피드 동시 수집기 #
+import json
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import feedparser
+
+from date_normalizer import DateNormalizer
+from feed_stream import FeedStreamParser
+from http_client import create_session
+
+
+# 캐시에 남길 기사 필드
+CACHED_ENTRY_FIELDS = ('title', 'summary', 'description', 'link', 'published', 'published_parsed')
+
+
+def build_feed(title, entries):
+    """피드 제목과 기사 목록을 feedparser 결과 형태로 묶기"""
+    feed = feedparser.FeedParserDict()
+    feed['feed'] = feedparser.FeedParserDict()
+    if title:
+        feed['feed']['title'] = title
+    feed['entries'] = entries
+    return feed
+
+
+class FeedCache:
+    """피드별 ETag / Last-Modified / 마지막 기사 목록 캐시 (조건부 GET용)"""
+
+    def __init__(self, path='feed_cache.json'):
+        self.path = path
+        # 마감 후에도 남은 수집 스레드가 put할 수 있어 저장과 잠금을 함께 씀
+        self.lock = threading.Lock()
+        self.data = self.load()
+
+    def load(self):
+        """캐시 파일 불러오기"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                print(f"📋 피드 캐시 불러옴: {len(data)}개")
+                return data
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"❌ 피드 캐시 불러오기 실패: {e}")
+            return {}
+
+    def save(self):
+        """캐시 파일 저장 (복사본을 임시 파일에 쓴 뒤 교체해 저장 도중 실패해도 기존 캐시 유지)"""
+        with self.lock:
+            data = dict(self.data)
+        temp_path = self.path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"❌ 피드 캐시 저장 실패: {e}")
+
+    def get(self, source):
+        return self.data.get(source)
+
+    def put(self, source, etag, modified, feed):
+        """파싱 결과를 검증자(ETag/Last-Modified)와 함께 저장"""
+        if not etag and not modified:
+            # 조건부 요청을 보낼 수 없는 피드는 저장하지 않음
+            with self.lock:
+                self.data.pop(source, None)
+            return
+        item = {
+            'etag': etag,
+            'modified': modified,
+            'title': feed.feed.get('title'),
+            'entries': [
+                {field: entry[field] for field in CACHED_ENTRY_FIELDS if field in entry}
+                for entry in feed.entries
+            ]
+        }
+        with self.lock:
+            self.data[source] = item
+
+    def restore(self, cached):
+        """캐시된 기사 목록을 feedparser 결과 형태로 복원 (재파싱 없음)"""
+        return build_feed(
+            cached.get('title'),
+            [feedparser.FeedParserDict(entry) for entry in cached['entries']]
+        )
+
+
+class FeedFetcher:
+    def __init__(self, max_workers=8, feed_timeout=15, total_timeout=45, cache=None, session=None,
+                 date_normalizer=None):
+        # 동시에 받을 피드 수 / 피드별 타임아웃(초) / 전체 수집 마감(초)
+        self.max_workers = max_workers
+        self.feed_timeout = feed_timeout
+        self.total_timeout = total_timeout
+        self.cache = cache
+        # 피드 본문은 공용 세션으로 받아 feedparser에는 bytes로 넘김
+        self.session = session if session is not None else create_session(pool_size=max_workers)
+        self.date_normalizer = date_normalizer or DateNormalizer()
+
+    def fetch_one(self, source, max_entries=None, cutoff=None):
+        """피드 하나 다운로드 후 파싱 (변경 없으면 캐시 사용)"""
+        headers = {'User-Agent': feedparser.USER_AGENT}
+        cached = self.cache.get(source) if self.cache else None
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('modified'):
+                headers['If-Modified-Since'] = cached['modified']
+
+        # timeout은 소켓 읽기마다 적용되므로, 느리게 계속 보내는 서버를 위해 전체 다운로드 마감도 둠
+        deadline = time.monotonic() + self.feed_timeout
+        with self.session.get(source, headers=headers, timeout=self.feed_timeout, stream=True) as response:
+            if response.status_code == 304 and cached:
+                print(f"♻️ 변경 없음 (304), 캐시 사용: {source}")
+                return self.cache.restore(cached)
+
+            response.raise_for_status()
+            feed = self.parse_stream(source, response, max_entries, cutoff, deadline)
+
+        if self.cache:
+            self.cache.put(
+                source,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                feed
+            )
+        return feed
+
+    def parse_stream(self, source, response, max_entries=None, cutoff=None, deadline=None):
+        """본문을 받는 대로 파싱하고, 필요한 기사를 다 모으면 다운로드 중단
+
+        deadline(time.monotonic 기준)을 넘기면 받던 중이라도 TimeoutError로 중단한다.
+        """
+        stream = response.iter_content(chunk_size=16 * 1024)
+        received = []
+
+        def chunks():
+            for chunk in stream:
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError(f"피드 다운로드 시간 초과 ({self.feed_timeout}초)")
+                received.append(chunk)
+                yield chunk
+
+        parser = FeedStreamParser(
+            max_entries=max_entries,
+            cutoff=cutoff,
+            date_normalizer=self.date_normalizer,
+            source=source
+        )
+        try:
+            entries = list(parser.iter_entries(chunks()))
+        except ET.ParseError as e:
+            # XML이 깨진 피드는 남은 본문까지 받아 feedparser로 전체 파싱
+            print(f"⚠️ 스트리밍 파싱 실패, 전체 파싱으로 전환: {source} ({e})")
+            for _ in chunks():
+                pass
+            feed = feedparser.parse(b''.join(received))
+            if max_entries:
+                feed['entries'] = feed.entries[:max_entries]
+            return feed
+
+        return build_feed(parser.title, entries)
+
+    def fetch_all(self, sources, max_entries=None, cutoff=None):
+        """모든 피드를 동시에 수집 (결과는 sources 순서 그대로)
+
+        max_entries: 피드별 최대 기사 수, cutoff: 이 시각(epoch 초) 이전 기사는 읽지 않음
+        """
+        if not sources:
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(sources)))
+        futures = {}
+        for source in sources:
+            print(f"📡 {source}에서 뉴스 수집 중...")
+            futures[source] = executor.submit(self.fetch_one, source, max_entries, cutoff)
+
+        # 가장 느린 피드 기준으로 기다리되, 전체 마감 시간은 넘기지 않음
+        done, _ = wait(futures.values(), timeout=self.total_timeout)
+        executor.shutdown(wait=False)
+
+        results = []
+        for source in sources:
+            future = futures[source]
+            if future not in done:
+                future.cancel()
+                print(f"⏰ 수집 시간 초과 ({self.total_timeout}초): {source}")
+                continue
+            try:
+                results.append((source, future.result()))
+            except Exception as e:
+                print(f"❌ Error fetching from {source}: {e}")
+
+        if self.cache:
+            self.cache.save()
+
+        return results
@@ -0,0 +1,36 @@
+# 공용 HTTP 세션 (커넥션 풀 + keep-alive + 재시도) #
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class TimeoutSession(requests.Session):
+    """timeout을 따로 주지 않은 요청에도 기본 타임아웃을 적용하는 세션"""
+
+    def __init__(self, timeout=30):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_session(pool_size=10, retries=2, backoff_factor=0.5, timeout=30):
+    """피드/LLM 호출이 함께 쓰는 keep-alive 세션 생성"""
+    # GET/HEAD만 자동 재시도 (POST인 LLM 호출은 중복 과금 위험 때문에 제외)
+    # Retry-After는 따르지 않음: 서버가 몇 시간을 요구하면 수집 스레드가 그동안 잠들어 실행이 끝나지 않음
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = TimeoutSession(timeout=timeout)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
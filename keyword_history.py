@@ -0,0 +1,83 @@
+# 키워드 일간 빈도 시계열 저장소 (SQLite) #
+import json
+import sqlite3
+
+
+class KeywordHistoryStore:
+    """키워드별 일간 빈도를 날짜별로 쌓아 두는 저장소
+
+    (keyword, day)가 기본 키라서 같은 날 다시 실행하면 그날 값만 덮어쓰고,
+    이전 날짜 기록은 그대로 남는다. 키워드/기간 조회는 인덱스를 타므로
+    전체 기록을 메모리에 올리지 않는다.
+    """
+
+    def __init__(self, path='keyword_history.db'):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS keyword_counts (
+                    keyword TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (keyword, day)
+                ) WITHOUT ROWID
+                """
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_keyword_counts_day ON keyword_counts (day)"
+            )
+
+    def close(self):
+        self.conn.close()
+
+    def record(self, day, counts):
+        """하루치 키워드 빈도 저장 (같은 날 재실행이면 그날 값 교체)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM keyword_counts WHERE day = ?", (day,))
+            self.conn.executemany(
+                "INSERT INTO keyword_counts (keyword, day, count) VALUES (?, ?, ?)",
+                [(keyword, day, int(count)) for keyword, count in counts.items()]
+            )
+
+    def days(self, start_day=None, end_day=None):
+        """기록이 있는 날짜 목록 (오름차순)"""
+        rows = self.conn.execute(
+            "SELECT DISTINCT day FROM keyword_counts WHERE day >= ? AND day <= ? ORDER BY day",
+            (start_day or '0000-00-00', end_day or '9999-99-99')
+        )
+        return [row[0] for row in rows]
+
+    def history(self, keywords, start_day, end_day):
+        """키워드별 {날짜: 빈도} (기간 양 끝 포함)"""
+        result = {keyword: {} for keyword in keywords}
+        keywords = list(keywords)
+        # SQLite 바인딩 변수 개수 제한을 넘지 않게 나눠서 조회
+        for i in range(0, len(keywords), 500):
+            chunk = keywords[i:i + 500]
+            rows = self.conn.execute(
+                f"""
+                SELECT keyword, day, count FROM keyword_counts
+                WHERE keyword IN ({','.join('?' * len(chunk))}) AND day >= ? AND day <= ?
+                """,
+                chunk + [start_day, end_day]
+            )
+            for keyword, day, count in rows:
+                result[keyword][day] = count
+        return result
+
+    def import_json(self, path, day):
+        """예전 yesterday_keywords.json 기록을 한 번만 옮겨오기 (저장소가 비어 있을 때)"""
+        if self.days():
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"❌ 이전 키워드 파일 변환 실패: {e}")
+            return
+        self.record(day, data)
+        print(f"📋 {path} → 키워드 기록 저장소로 이전: {len(data)}개 ({day})")
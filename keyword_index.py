@@ -0,0 +1,123 @@
+# 기사별 키워드 집계 캐시 (증분 키워드 분석) #
+import hashlib
+import json
+import time
+from collections import Counter
+
+from keyword_matcher import TOKENIZER_VERSION, KeywordMatcher, tokenize
+
+
+class KeywordIndex:
+    """기사 링크 + 내용 해시 기준으로 기사별 키워드 집계 벡터를 저장
+
+    하루 합계는 벡터들의 합이므로, 토큰화는 처음 보는(또는 내용이 바뀐) 기사에만 한다.
+    벡터는 발견 키워드와 무관한 값만 담는다:
+      words       - 불용어를 뺀 일반 단어 빈도 (키워드 자동 발견용)
+      capitalized - 대문자로 시작하는 단어 (회사명, 제품명 후보)
+      compounds   - 복합 키워드 매치 수
+      unigrams    - 복합 키워드에 포함되지 않은 단어 빈도 (단일 키워드 집계용)
+    """
+
+    def __init__(self, path='keyword_index.json', stop_words=(), compound_keywords=None, retention_days=7):
+        self.path = path
+        self.stop_words = set(stop_words)
+        self.retention_days = retention_days
+
+        compound_keywords = compound_keywords or {}
+        patterns = {}
+        for display_name, compound_patterns in compound_keywords.items():
+            for pattern in compound_patterns:
+                patterns[tuple(tokenize(pattern.lower()))] = display_name.title()
+        self.matcher = KeywordMatcher(patterns)
+
+        # 불용어/복합 키워드 설정이나 토큰화 규칙이 바뀌면 기존 벡터는 모두 무효
+        settings = json.dumps(
+            [TOKENIZER_VERSION, sorted(self.stop_words), sorted(compound_keywords.items())], ensure_ascii=False
+        )
+        self.settings_hash = hashlib.sha1(settings.encode('utf-8')).hexdigest()[:12]
+
+        self.data = self.load()
+
+    def load(self):
+        """인덱스 파일 불러오기"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                print(f"📋 키워드 인덱스 불러옴: {len(data)}개 기사")
+                return data
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"❌ 키워드 인덱스 불러오기 실패: {e}")
+            return {}
+
+    def save(self):
+        """오래된 기사를 정리하고 인덱스 파일 저장"""
+        expire_before = time.time() - self.retention_days * 24 * 3600
+        self.data = {
+            link: item for link, item in self.data.items()
+            if item.get('last_seen', 0) >= expire_before
+        }
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"❌ 키워드 인덱스 저장 실패: {e}")
+
+    def content_hash(self, article):
+        content = f"{self.settings_hash}\n{article.get('title', '')}\n{article.get('summary', '')}"
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def build_vector(self, article):
+        """기사 하나를 토큰화해 집계 벡터 생성"""
+        tokens = tokenize(f"{article.get('title', '')} {article.get('summary', '')}")
+        lowered = [token.lower() for token in tokens]
+
+        words = Counter()
+        capitalized = {}
+        for token, word in zip(tokens, lowered):
+            if not (token.isalpha() and token.isascii()) or word in self.stop_words or len(word) < 3:
+                continue
+            if len(word) <= 15:
+                words[word] += 1
+            if len(token) <= 16 and token[0].isupper() and token[1:].islower():
+                capitalized[token] = True
+
+        compounds = Counter()
+        covered = set()
+        for start, length, label in self.matcher.matches(lowered):
+            compounds[label] += 1
+            covered.update(range(start, start + length))
+
+        unigrams = Counter(
+            word for position, (token, word) in enumerate(zip(tokens, lowered))
+            if position not in covered and token.isalpha() and token.isascii()
+            and 3 <= len(word) <= 16 and word not in self.stop_words
+        )
+
+        return {
+            'words': dict(words),
+            'capitalized': list(capitalized),
+            'compounds': dict(compounds),
+            'unigrams': dict(unigrams)
+        }
+
+    def vectors(self, articles):
+        """기사별 집계 벡터 목록 (캐시에 있으면 재사용, 새 기사만 토큰화)"""
+        now = time.time()
+        result = []
+        new_count = 0
+        for article in articles:
+            key = article.get('link') or article.get('title', '')
+            content_hash = self.content_hash(article)
+            item = self.data.get(key)
+            if not item or item.get('hash') != content_hash:
+                item = {'hash': content_hash, 'vector': self.build_vector(article)}
+                self.data[key] = item
+                new_count += 1
+            item['last_seen'] = now
+            result.append(item['vector'])
+
+        print(f"🗂️ 키워드 인덱스: 새 기사 {new_count}개 분석, {len(articles) - new_count}개 재사용")
+        self.save()
+        return result
@@ -0,0 +1,88 @@
+# 토큰화 + 다중 키워드 매칭 (Aho-Corasick) #
+import re
+from collections import Counter, deque
+
+# 단어 경계 기준 토큰 ('3.5'처럼 안쪽 마침표는 한 토큰으로 유지, 하이픈은 나눔)
+# 'computer-vision' → computer, vision / 'gpt-4' 키워드는 ('gpt', '4') 두 토큰 패턴으로 매칭
+TOKEN_RE = re.compile(r'[A-Za-z0-9]+(?:\.[A-Za-z0-9]+)*')
+
+# 토큰화 규칙을 바꾸면 올려서 캐시된 기사별 집계 무효화
+TOKENIZER_VERSION = 'tokens-v2'
+
+
+def tokenize(text):
+    """텍스트 → 토큰 목록 (원래 대소문자 유지)"""
+    return TOKEN_RE.findall(text)
+
+
+class KeywordMatcher:
+    """모든 키워드를 하나의 오토마톤으로 컴파일해 토큰 스트림을 한 번만 훑으며 세기
+
+    patterns: {토큰 튜플: 표시명}. 토큰 단위로 맞추므로 'vision'이 'television'
+    안에서 잡히지 않는다. 겹치는 키워드는 왼쪽에서 시작하는 것, 그중에서도
+    더 긴 것이 이긴다 ('github copilot'이 'github'보다 우선).
+    """
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        # 상태마다 그 위치에서 끝나는 (패턴 길이, 표시명) 목록
+        self.outputs = [[]]
+
+        for pattern, label in patterns.items():
+            if pattern:
+                self.add(pattern, label)
+        self.build()
+
+    def add(self, pattern, label):
+        state = 0
+        for symbol in pattern:
+            next_state = self.goto[state].get(symbol)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][symbol] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = next_state
+        self.outputs[state].append((len(pattern), label))
+
+    def build(self):
+        """실패 링크 계산 (BFS)"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for symbol, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and symbol not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(symbol, 0)
+                if self.fail[next_state] == next_state:
+                    self.fail[next_state] = 0
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+    def find_all(self, text):
+        """겹치는 것까지 모든 매치 (시작 위치, 길이, 표시명)"""
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        state = 0
+        for position, symbol in enumerate(text):
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            for length, label in outputs[state]:
+                yield position - length + 1, length, label
+
+    def matches(self, text):
+        """겹치지 않게 고른 매치 목록 (왼쪽 우선, 같은 위치면 긴 패턴 우선)"""
+        selected = []
+        matched_until = 0
+        for start, length, label in sorted(self.find_all(text), key=lambda m: (m[0], -m[1])):
+            if start >= matched_until:
+                selected.append((start, length, label))
+                matched_until = start + length
+        return selected
+
+    def count(self, text):
+        """표시명별 등장 횟수"""
+        return Counter(label for _, _, label in self.matches(text))
@@ -0,0 +1,73 @@
+# LLM 응답 캐시 (같은 기사 묶음이면 API 재호출 없이 재사용) #
+import hashlib
+import json
+import time
+
+
+class LLMResponseCache:
+    """프롬프트 버전 + 모델 + 정규화한 기사 목록 해시를 키로 LLM 응답을 저장
+
+    ttl_hours가 지난 항목은 무시하고, max_entries를 넘으면 가장 오래 안 쓴 항목부터 지운다.
+    """
+
+    def __init__(self, path='llm_cache.json', ttl_hours=24, max_entries=50):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.data = self.load()
+
+    def load(self):
+        """캐시 파일 불러오기"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"❌ LLM 캐시 불러오기 실패: {e}")
+            return {}
+
+    def save(self):
+        """만료/초과 항목을 정리하고 저장"""
+        now = time.time()
+        entries = [
+            (key, item) for key, item in self.data.items()
+            if now - item['created'] < self.ttl
+        ]
+        entries.sort(key=lambda pair: pair[1]['last_used'], reverse=True)
+        self.data = dict(entries[:self.max_entries])
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"❌ LLM 캐시 저장 실패: {e}")
+
+    def make_key(self, prompt_version, model, articles, scope=''):
+        """기사 순서/공백 차이에 영향받지 않는 캐시 키 (scope: 스텁 등 실제 API가 아닌 응답 구분)"""
+        normalized = sorted(
+            (
+                ' '.join(article.get('title', '').split()).lower(),
+                article.get('link', ''),
+                ' '.join(article.get('summary', '').split())
+            )
+            for article in articles
+        )
+        parts = [prompt_version, model, normalized]
+        if scope:
+            parts.append(scope)
+        payload = json.dumps(parts, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """유효한 캐시 응답 (없거나 만료면 None)"""
+        item = self.data.get(key)
+        if not item or time.time() - item['created'] >= self.ttl:
+            return None
+        item['last_used'] = time.time()
+        self.save()
+        return item['value']
+
+    def put(self, key, value):
+        now = time.time()
+        self.data[key] = {'value': value, 'created': now, 'last_used': now}
+        self.save()
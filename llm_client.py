@@ -0,0 +1,122 @@
+# LLM API 호출 재시도 (지수 백오프 + Retry-After + 전체 마감 시간) #
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+# 잠시 후 다시 시도하면 성공할 수 있는 응답 코드
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """분당 요청 수 제한 (여러 스레드가 함께 쓰며 요청 사이 간격을 고르게 유지)"""
+
+    def __init__(self, requests_per_minute=15):
+        self.interval = 60.0 / requests_per_minute
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def acquire(self, deadline=None):
+        """다음 요청 차례까지 대기 (차례가 deadline 이후면 기다리지 않고 False)"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_time)
+            if deadline is not None and slot >= deadline:
+                return False
+            self.next_time = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+        return True
+
+
+class LLMClient:
+    """LLM POST 요청을 재시도하는 클라이언트
+
+    429/5xx/타임아웃/연결 오류면 지터가 들어간 지수 백오프로 다시 시도하고,
+    서버가 Retry-After를 주면 그 시간을 따른다. deadline(time.monotonic 기준)을
+    넘기게 되면 더 기다리지 않고 마지막 결과를 돌려준다.
+    """
+
+    def __init__(self, session, max_attempts=4, base_delay=1.0, max_delay=30.0, timeout=30, rate_limiter=None):
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+
+    def retry_after(self, response):
+        """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 초 (없으면 None)"""
+        if response is None:
+            return None
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def backoff(self, attempt):
+        """지터가 들어간 지수 백오프 (full jitter)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def release(self, response):
+        """재시도/중단할 응답의 짧은 오류 본문을 읽고 닫아 keep-alive 연결을 풀에 돌려주기
+
+        본문은 미리 읽어 두므로 호출한 쪽은 닫힌 뒤에도 response.text를 쓸 수 있다.
+        """
+        try:
+            response.content
+        except requests.exceptions.RequestException:
+            pass
+        finally:
+            response.close()
+
+    def post(self, url, deadline=None, **kwargs):
+        """재시도하며 POST (성공/재시도 불가 응답은 그대로, 모두 실패하면 마지막 응답 또는 None)"""
+        response = None
+        for attempt in range(1, self.max_attempts + 1):
+            timeout = self.timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    print("⏰ LLM 요청 마감 시간 초과")
+                    return response
+                timeout = min(timeout, remaining)
+            if self.rate_limiter and not self.rate_limiter.acquire(deadline):
+                print("⏰ 요청 속도 제한 대기가 마감 시간을 넘어 중단")
+                return response
+
+            try:
+                response = self.session.post(url, timeout=timeout, **kwargs)
+                if response.status_code not in RETRYABLE_STATUS:
+                    return response
+                reason = f"HTTP {response.status_code}"
+                # stream=True 응답은 닫기 전까지 연결을 붙잡으므로 대기/중단 전에 바로 반납
+                self.release(response)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                response = None
+                reason = f"{type(e).__name__}"
+
+            if attempt == self.max_attempts:
+                print(f"❌ 재시도 {self.max_attempts - 1}회 후에도 실패: {reason}")
+                return response
+
+            delay = self.retry_after(response)
+            if delay is None:
+                delay = self.backoff(attempt)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                print(f"⏰ 재시도 대기({delay:.1f}초)가 마감 시간을 넘어 중단: {reason}")
+                return response
+
+            print(f"🔁 {reason} → {delay:.1f}초 후 재시도 ({attempt}/{self.max_attempts - 1})")
+            time.sleep(delay)
+
+        return response
@@ -0,0 +1,285 @@
+# LLM 제공자 (Gemini / Claude / 오프라인 스텁) #
+import json
+import re
+import threading
+from abc import ABC, abstractmethod
+
+from llm_client import LLMClient, RateLimiter
+from llm_stream import claude_event_text, gemini_event_text, read_stream
+from prompt_budget import estimate_tokens
+
+# 프롬프트의 번호 붙은 기사 줄 ("1. 제목")
+ITEM_RE = re.compile(r'^(\d+)\. (.+)$', re.MULTILINE)
+
+
+def prompt_items(prompt):
+    """기사 분석 프롬프트의 (번호, 제목) 목록
+
+    번호 붙은 응답 규칙 줄과 섞이지 않도록 "뉴스 목록:"과 "응답 규칙:" 사이만 읽고,
+    같은 번호는 처음 나온 것만 쓴다.
+    """
+    start = prompt.find('뉴스 목록:')
+    end = prompt.find('응답 규칙:', start + 1)
+    if start != -1:
+        prompt = prompt[start:end] if end != -1 else prompt[start:]
+    items = {}
+    for number, title in ITEM_RE.findall(prompt):
+        items.setdefault(int(number), title.strip())
+    return list(items.items())
+
+
+def offline_response(prompt):
+    """프롬프트 형식에 맞는 JSON 응답을 네트워크 없이 만들기 (항상 같은 입력 → 같은 출력)
+
+    기사 분석 프롬프트에는 기사 제목을 요약으로, 요약 프롬프트에는 앞쪽 기사 요약을 그대로 돌려준다.
+    """
+    if '"articles"' in prompt:
+        return {
+            'articles': [
+                {
+                    'id': number,
+                    'summary': title,
+                    'entities': [],
+                    'opportunities': [],
+                    'risks': [],
+                    'competitive_moves': [],
+                    'focus_areas': [],
+                    'technologies': []
+                }
+                for number, title in prompt_items(prompt)
+            ]
+        }
+    summaries = [line[2:].strip() for line in prompt.splitlines() if line.startswith('- ')]
+    return {
+        'today_summary': ' '.join(summaries[:2]) or '오프라인 모드 요약입니다.',
+        'key_trends': summaries[:3]
+    }
+
+
+class LLMProvider(ABC):
+    """LLM 제공자 공통 부분
+
+    제공자마다 동시 호출 수(concurrency), 분당 호출 수, 타임아웃을 따로 두고,
+    호출 수와 입출력 토큰, 비용(100만 토큰당 USD 단가 기준)을 집계한다.
+    하위 클래스는 request()에서 스트리밍 응답 텍스트를 parser에 넣는다.
+    """
+
+    name = 'llm'
+    default_base_url = ''
+
+    def __init__(self, model, api_key=None, session=None, base_url=None, concurrency=2, requests_per_minute=15,
+                 timeout=30, input_price=0.0, output_price=0.0, max_attempts=4, base_delay=1.0, max_delay=30.0):
+        self.model = model
+        self.api_key = api_key
+        self.base_url = (base_url or self.default_base_url).rstrip('/')
+        self.concurrency = concurrency
+        self.input_price = input_price
+        self.output_price = output_price
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self.client = LLMClient(
+            session,
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            timeout=timeout,
+            rate_limiter=RateLimiter(requests_per_minute)
+        )
+        self.lock = threading.Lock()
+        self.usage = {'calls': 0, 'failures': 0, 'input_tokens': 0, 'output_tokens': 0}
+
+    @property
+    def label(self):
+        return f"{self.name} ({self.model})"
+
+    def available(self):
+        """API 키가 있어 호출할 수 있는지"""
+        return bool(self.api_key)
+
+    def cache_scope(self):
+        """캐시 키에 넣을 구분값 (기본 API 주소면 '', 스텁 서버 등으로 바꿨으면 그 주소)"""
+        return '' if self.base_url == self.default_base_url else self.base_url
+
+    def generate(self, prompt, deadline, parser):
+        """스트리밍 호출 → parser에 응답 텍스트 넣기 (동시 호출 수 제한 + 사용량 집계)"""
+        usage = {'input_tokens': None, 'output_tokens': None, 'text': []}
+        with self.slots:
+            answered = self.request(prompt, deadline, parser, usage)
+
+        with self.lock:
+            if not answered:
+                self.usage['failures'] += 1
+                return
+            # API가 사용량을 알려주지 않으면 프롬프트/응답 길이로 추정
+            self.usage['calls'] += 1
+            self.usage['input_tokens'] += usage['input_tokens'] or estimate_tokens(prompt)
+            self.usage['output_tokens'] += usage['output_tokens'] or estimate_tokens(''.join(usage['text']))
+
+    @abstractmethod
+    def request(self, prompt, deadline, parser, usage):
+        """응답을 받았으면 True (하위 클래스에서 구현)"""
+
+    def cost(self):
+        return (self.usage['input_tokens'] * self.input_price + self.usage['output_tokens'] * self.output_price) / 1_000_000
+
+    def report(self):
+        """사용량/비용 한 줄 요약 (호출이 없었으면 None)"""
+        if not self.usage['calls'] and not self.usage['failures']:
+            return None
+        return (
+            f"{self.label}: 호출 {self.usage['calls']}회 (실패 {self.usage['failures']}회), "
+            f"입력 {self.usage['input_tokens']:,} / 출력 {self.usage['output_tokens']:,} 토큰, "
+            f"약 ${self.cost():.4f}"
+        )
+
+    def stream(self, response, parser, deadline, event_text, usage):
+        """SSE 응답을 parser로 읽으며 받은 텍스트를 usage에 모으기 → 종료 사유"""
+        def collect(event):
+            self.read_usage(event, usage)
+            text, reason = event_text(event)
+            if text:
+                usage['text'].append(text)
+            return text, reason
+        return read_stream(response, parser, collect, deadline)
+
+    def read_usage(self, event, usage):
+        """스트림 이벤트에 실린 토큰 사용량 기록 (제공자별)"""
+
+
+class GeminiProvider(LLMProvider):
+    """Google Gemini (streamGenerateContent, SSE)"""
+
+    name = 'gemini'
+    default_base_url = 'https://generativelanguage.googleapis.com'
+
+    def read_usage(self, event, usage):
+        metadata = event.get('usageMetadata') or {}
+        if metadata.get('promptTokenCount'):
+            usage['input_tokens'] = metadata['promptTokenCount']
+        if metadata.get('candidatesTokenCount'):
+            usage['output_tokens'] = metadata['candidatesTokenCount']
+
+    def request(self, prompt, deadline, parser, usage):
+        url = f"{self.base_url}/v1beta/models/{self.model}:streamGenerateContent?alt=sse&key={self.api_key}"
+
+        headers = {
+            'Content-Type': 'application/json',
+        }
+
+        data = {
+            "contents": [{
+                "parts": [{
+                    "text": prompt
+                }]
+            }]
+        }
+
+        try:
+            print(f"🔄 Gemini API 호출 시작... ({self.model})")
+            response = self.client.post(url, deadline=deadline, headers=headers, json=data, stream=True)
+            if response is None:
+                return False
+
+            print(f"📡 API 응답 상태: {response.status_code}")
+
+            if response.status_code == 200:
+                finish_reason = self.stream(response, parser, deadline, gemini_event_text, usage)
+                if finish_reason == 'MAX_TOKENS':
+                    print("⚠️ 최대 토큰 수에 도달해 응답이 잘렸습니다")
+                return True
+
+            print(f"❌ API 호출 실패: {response.status_code}")
+            print(f"🔍 응답 내용: {response.text}")
+            return False
+
+        except Exception as e:
+            print(f"❌ Gemini API 오류: {e}")
+            return False
+
+
+class ClaudeProvider(LLMProvider):
+    """Anthropic Claude (messages API, SSE)"""
+
+    name = 'claude'
+    default_base_url = 'https://api.anthropic.com'
+
+    def __init__(self, model, max_tokens=4096, **kwargs):
+        super().__init__(model, **kwargs)
+        self.max_tokens = max_tokens
+
+    def read_usage(self, event, usage):
+        if event.get('type') == 'message_start':
+            input_tokens = ((event.get('message') or {}).get('usage') or {}).get('input_tokens')
+            if input_tokens:
+                usage['input_tokens'] = input_tokens
+        elif event.get('type') == 'message_delta':
+            output_tokens = (event.get('usage') or {}).get('output_tokens')
+            if output_tokens:
+                usage['output_tokens'] = output_tokens
+
+    def request(self, prompt, deadline, parser, usage):
+        headers = {
+            'Content-Type': 'application/json',
+            'x-api-key': self.api_key,
+            'anthropic-version': '2023-06-01'
+        }
+
+        data = {
+            'model': self.model,
+            'max_tokens': self.max_tokens,
+            'stream': True,
+            'messages': [
+                {
+                    'role': 'user',
+                    'content': prompt
+                }
+            ]
+        }
+
+        try:
+            print(f"🔄 Claude API 호출 시작... ({self.model})")
+            response = self.client.post(
+                f"{self.base_url}/v1/messages", deadline=deadline, headers=headers, json=data, stream=True
+            )
+            if response is None:
+                return False
+
+            print(f"📡 API 응답 상태: {response.status_code}")
+
+            if response.status_code == 200:
+                finish_reason = self.stream(response, parser, deadline, claude_event_text, usage)
+                if finish_reason == 'max_tokens':
+                    print("⚠️ 최대 토큰 수에 도달해 응답이 잘렸습니다")
+                return True
+
+            print(f"❌ API 호출 실패: {response.status_code}")
+            print(f"🔍 응답 내용: {response.text}")
+            return False
+
+        except Exception as e:
+            print(f"❌ Claude API 오류: {e}")
+            return False
+
+
+class StubProvider(LLMProvider):
+    """네트워크 없이 offline_response()를 돌려주는 오프라인 스텁
+
+    API 키 없이 전체 파이프라인을 돌려 볼 때 쓴다. HTTP 경로(재시도, 스트리밍)까지
+    재려면 llm_stub_server.py를 띄우고 Gemini/Claude 제공자의 base_url을 그쪽으로 돌린다.
+    """
+
+    name = 'stub'
+
+    def available(self):
+        return True
+
+    def cache_scope(self):
+        return 'stub'
+
+    def request(self, prompt, deadline, parser, usage):
+        print(f"🔄 오프라인 스텁 응답 생성... ({self.model})")
+        text = json.dumps(offline_response(prompt), ensure_ascii=False)
+        # 실제 스트림처럼 조각으로 나눠 넣기
+        for i in range(0, len(text), 200):
+            usage['text'].append(text[i:i + 200])
+            parser.feed(text[i:i + 200])
+        return True
@@ -0,0 +1,202 @@
+# LLM 스트리밍 응답 (SSE) + 점진적 JSON 파서 #
+import json
+import time
+
+import requests
+
+
+def iter_sse_events(response):
+    """SSE 응답 → 이벤트별 JSON dict (data: 줄만 사용, 파싱 안 되는 이벤트는 건너뜀)"""
+    data_lines = []
+    # 바이트로 줄을 나눈 뒤 UTF-8로 디코딩 (text/event-stream은 charset이 없으면 latin-1로
+    # 디코딩되고, 그 문자열을 splitlines()하면 한글 바이트(\x85 등)에서 줄이 잘림)
+    for line in response.iter_lines():
+        if line is None:
+            continue
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        if not line:
+            # 빈 줄 = 이벤트 끝
+            if data_lines:
+                payload = '\n'.join(data_lines)
+                data_lines = []
+                if payload.strip() == '[DONE]':
+                    return
+                try:
+                    yield json.loads(payload)
+                except ValueError:
+                    continue
+            continue
+        if line.startswith('data:'):
+            data_lines.append(line[5:].lstrip())
+    if data_lines:
+        try:
+            yield json.loads('\n'.join(data_lines))
+        except ValueError:
+            pass
+
+
+def gemini_event_text(event):
+    """streamGenerateContent 이벤트 → (텍스트 조각, 종료 사유)"""
+    candidates = event.get('candidates') or []
+    if not candidates:
+        return '', None
+    candidate = candidates[0]
+    parts = (candidate.get('content') or {}).get('parts') or []
+    text = ''.join(part.get('text', '') for part in parts)
+    return text, candidate.get('finishReason')
+
+
+def claude_event_text(event):
+    """Claude messages 스트림 이벤트 → (텍스트 조각, 종료 사유)"""
+    event_type = event.get('type')
+    if event_type == 'content_block_delta':
+        return (event.get('delta') or {}).get('text', ''), None
+    if event_type == 'message_delta':
+        return '', (event.get('delta') or {}).get('stop_reason')
+    return '', None
+
+
+class PartialJSONParser:
+    """조각으로 들어오는 텍스트에서 JSON 객체를 점진적으로 읽는 파서
+
+    첫 '{' 앞의 텍스트(```json 등)는 무시하고, 값 하나가 끝날 때마다
+    그 위치와 열려 있는 괄호를 기록해 둔다. 스트림이 중간에 끊겨도
+    마지막으로 끝난 값까지 괄호를 닫아 유효한 JSON으로 돌려준다.
+    받은 텍스트는 한 글자씩 한 번만 훑는다.
+    """
+
+    def __init__(self):
+        self.buffer = []
+        self.pos = 0
+        self.root_start = None
+        self.stack = []  # '{' 또는 '['
+        self.expect_key = []  # 객체마다 다음 문자열이 키인지
+        self.in_string = False
+        self.string_is_key = False
+        self.escape = False
+        self.in_literal = False
+        self.safe_end = None
+        self.safe_closers = ''
+        self.complete = False
+        self.result = {}
+        self.parsed_end = None
+
+    def feed(self, text):
+        """텍스트 조각 추가 → 새로 채워진 최상위 필드 목록"""
+        if self.complete or not text:
+            return []
+        self.buffer.append(text)
+        refresh = False
+        for offset, char in enumerate(text):
+            index = self.pos + offset
+            if self.scan(char, index):
+                refresh = True
+            if self.complete:
+                break
+        self.pos += len(text)
+        if not refresh:
+            return []
+        return self.refresh()
+
+    def scan(self, char, index):
+        """한 글자 처리 (깊이 2 이하에서 값이 끝났으면 True)"""
+        if self.root_start is None:
+            if char == '{':
+                self.root_start = index
+                self.stack.append('{')
+                self.expect_key.append(True)
+            return False
+
+        if self.in_string:
+            if self.escape:
+                self.escape = False
+            elif char == '\\':
+                self.escape = True
+            elif char == '"':
+                self.in_string = False
+                if not self.string_is_key:
+                    return self.mark_value(index + 1)
+            return False
+
+        finished = False
+        if self.in_literal and (char in ',]}' or char.isspace()):
+            self.in_literal = False
+            finished = self.mark_value(index)
+
+        if char == '"':
+            self.in_string = True
+            self.string_is_key = self.stack[-1] == '{' and self.expect_key[-1]
+        elif char in '{[':
+            self.stack.append(char)
+            self.expect_key.append(char == '{')
+        elif char in '}]':
+            self.stack.pop()
+            self.expect_key.pop()
+            if not self.stack:
+                self.complete = True
+            finished = self.mark_value(index + 1) or finished
+        elif char == ':':
+            self.expect_key[-1] = False
+        elif char == ',':
+            if self.stack[-1] == '{':
+                self.expect_key[-1] = True
+        elif not char.isspace():
+            self.in_literal = True
+        return finished
+
+    def mark_value(self, end):
+        """값이 끝난 위치와 그때 닫아야 할 괄호 기록"""
+        self.safe_end = end
+        self.safe_closers = ''.join('}' if bracket == '{' else ']' for bracket in reversed(self.stack))
+        return len(self.stack) <= 2
+
+    def refresh(self):
+        """마지막으로 끝난 값까지 파싱해 result 갱신 → 새 최상위 필드 목록"""
+        if self.safe_end is None or self.safe_end == self.parsed_end:
+            return []
+        text = ''.join(self.buffer)
+        self.buffer = [text]
+        try:
+            parsed = json.loads(text[self.root_start:self.safe_end] + self.safe_closers)
+        except ValueError:
+            return []
+        self.parsed_end = self.safe_end
+        if not isinstance(parsed, dict):
+            return []
+        new_fields = [key for key in parsed if key not in self.result]
+        self.result = parsed
+        return new_fields
+
+    def finish(self):
+        """스트림이 끝났을 때 지금까지 읽은 결과 (없으면 None)"""
+        self.refresh()
+        return self.result or None
+
+
+def read_stream(response, parser, event_text, deadline=None):
+    """SSE 응답을 읽으며 parser에 텍스트를 넣기 → 종료 사유 (끊기면 None)
+
+    deadline(time.monotonic 기준)을 넘기거나 연결이 끊기면 거기서 멈추고,
+    그때까지 받은 내용은 parser에 남아 있다.
+    """
+    finish_reason = None
+    received = 0
+    try:
+        for event in iter_sse_events(response):
+            text, reason = event_text(event)
+            if text:
+                received += len(text)
+                for field in parser.feed(text):
+                    print(f"📥 {field} 수신")
+            if reason:
+                finish_reason = reason
+            if deadline is not None and time.monotonic() >= deadline:
+                print("⏰ 마감 시간 초과로 스트림 중단")
+                break
+    except requests.exceptions.RequestException as e:
+        print(f"❌ 스트림 수신 중 끊김: {e}")
+    finally:
+        response.close()
+    print(f"📝 스트림 수신: {received}자 (종료 사유: {finish_reason})")
+    return finish_reason
@@ -0,0 +1,235 @@
+# 오프라인 LLM 스텁 서버 (Gemini generateContent / Claude messages 형식) #
+"""실제 API 없이 재시도/캐시/동시 호출 경로를 재기 위한 로컬 HTTP 서버
+
+실행:
+    python llm_stub_server.py --port 8787 --latency 0.5 --error-rate 0.1 --tokens-per-second 200
+
+파이프라인을 스텁 서버로 돌리기 (API 키는 아무 값이나):
+    GEMINI_BASE_URL=http://127.0.0.1:8787 CLAUDE_BASE_URL=http://127.0.0.1:8787 \\
+    GEMINI_API_KEY=stub CLAUDE_API_KEY=stub python GEMINI_gen_news.py
+
+응답 본문은 llm_providers.offline_response()로 만들어 항상 스키마에 맞는 JSON이다.
+오류 발생 여부는 --seed로 정한 난수열을 따르므로 같은 요청 순서면 같은 결과가 나온다.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from llm_providers import offline_response
+from prompt_budget import estimate_tokens
+
+GEMINI_PATH_RE = re.compile(r'^/v1beta/models/([^/:]+):(generateContent|streamGenerateContent)$')
+
+
+class StubConfig:
+    """스텁 서버 동작 설정과 요청 통계"""
+
+    def __init__(self, latency=0.2, error_rate=0.0, tokens_per_second=500, chunk_tokens=20, seed=1):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.tokens_per_second = tokens_per_second
+        self.chunk_tokens = chunk_tokens
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'errors': 0, 'output_tokens': 0}
+
+    def error_status(self):
+        """이번 요청을 오류로 응답할 상태 코드 (429/503, 정상이면 None, 요청 순서대로 같은 난수열)"""
+        with self.lock:
+            self.stats['requests'] += 1
+            if self.random.random() >= self.error_rate:
+                return None
+            self.stats['errors'] += 1
+            return self.random.choice([429, 503])
+
+    def record_output(self, tokens):
+        with self.lock:
+            self.stats['output_tokens'] += tokens
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """generateContent / streamGenerateContent / v1/messages 요청 처리"""
+
+    protocol_version = 'HTTP/1.1'
+    config = StubConfig()
+
+    def log_message(self, format, *args):
+        # 요청마다 찍히는 기본 접근 로그는 생략
+        pass
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self.send_json(400, {'error': {'message': 'invalid JSON body'}})
+            return
+
+        match = GEMINI_PATH_RE.match(path)
+        if match:
+            prompt = ''.join(
+                part.get('text', '')
+                for content in body.get('contents', [])
+                for part in content.get('parts', [])
+            )
+            api = 'gemini'
+            streaming = match.group(2) == 'streamGenerateContent'
+            model = match.group(1)
+        elif path == '/v1/messages':
+            prompt = ''.join(
+                message['content'] if isinstance(message.get('content'), str)
+                else ''.join(block.get('text', '') for block in message.get('content', []))
+                for message in body.get('messages', [])
+            )
+            api = 'claude'
+            streaming = bool(body.get('stream'))
+            model = body.get('model', 'claude-stub')
+        else:
+            self.send_json(404, {'error': {'message': f'unknown path {path}'}})
+            return
+
+        time.sleep(self.config.latency)
+        status = self.config.error_status()
+        if status:
+            self.send_json(status, {'error': {'message': 'stub overloaded'}}, {'Retry-After': '1'})
+            return
+
+        text = json.dumps(offline_response(prompt), ensure_ascii=False)
+        input_tokens = estimate_tokens(prompt)
+        output_tokens = estimate_tokens(text)
+        self.config.record_output(output_tokens)
+
+        if not streaming:
+            time.sleep(output_tokens / self.config.tokens_per_second)
+            if api == 'gemini':
+                self.send_json(200, self.gemini_payload(text, 'STOP', input_tokens, output_tokens))
+            else:
+                self.send_json(200, {
+                    'id': 'msg_stub',
+                    'type': 'message',
+                    'role': 'assistant',
+                    'model': model,
+                    'content': [{'type': 'text', 'text': text}],
+                    'stop_reason': 'end_turn',
+                    'usage': {'input_tokens': input_tokens, 'output_tokens': output_tokens}
+                })
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        chunks = self.split_tokens(text)
+        if api == 'gemini':
+            for i, chunk in enumerate(chunks):
+                last = i == len(chunks) - 1
+                self.pace(chunk)
+                self.send_event(None, self.gemini_payload(
+                    chunk, 'STOP' if last else None, input_tokens, output_tokens if last else None
+                ))
+        else:
+            self.send_event('message_start', {
+                'type': 'message_start',
+                'message': {
+                    'id': 'msg_stub', 'type': 'message', 'role': 'assistant', 'model': model,
+                    'content': [], 'usage': {'input_tokens': input_tokens, 'output_tokens': 1}
+                }
+            })
+            self.send_event('content_block_start', {
+                'type': 'content_block_start', 'index': 0, 'content_block': {'type': 'text', 'text': ''}
+            })
+            for chunk in chunks:
+                self.pace(chunk)
+                self.send_event('content_block_delta', {
+                    'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': chunk}
+                })
+            self.send_event('content_block_stop', {'type': 'content_block_stop', 'index': 0})
+            self.send_event('message_delta', {
+                'type': 'message_delta',
+                'delta': {'stop_reason': 'end_turn'},
+                'usage': {'output_tokens': output_tokens}
+            })
+            self.send_event('message_stop', {'type': 'message_stop'})
+
+    def gemini_payload(self, text, finish_reason, input_tokens, output_tokens):
+        candidate = {'content': {'parts': [{'text': text}], 'role': 'model'}, 'index': 0}
+        if finish_reason:
+            candidate['finishReason'] = finish_reason
+        usage = {'promptTokenCount': input_tokens}
+        if output_tokens is not None:
+            usage['candidatesTokenCount'] = output_tokens
+            usage['totalTokenCount'] = input_tokens + output_tokens
+        return {'candidates': [candidate], 'usageMetadata': usage}
+
+    def split_tokens(self, text):
+        """chunk_tokens 토큰 분량씩 나누기 (영문 4글자 ≈ 1토큰 기준)"""
+        size = max(1, self.config.chunk_tokens * 4)
+        return [text[i:i + size] for i in range(0, len(text), size)] or ['']
+
+    def pace(self, chunk):
+        """설정한 초당 토큰 수에 맞춰 대기"""
+        time.sleep(estimate_tokens(chunk) / self.config.tokens_per_second)
+
+    def send_event(self, event, data):
+        lines = f"event: {event}\n" if event else ''
+        lines += f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+        self.wfile.write(lines.encode('utf-8'))
+        self.wfile.flush()
+
+    def send_json(self, status, data, headers=None):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(host='127.0.0.1', port=8787, config=None):
+    """스텁 서버 생성 (serve_forever는 호출하는 쪽에서, port=0이면 빈 포트 자동 선택)"""
+    handler = type('ConfiguredStubHandler', (StubHandler,), {'config': config or StubConfig()})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='오프라인 LLM 스텁 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--latency', type=float, default=0.2, help='첫 응답까지 지연 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='429/503 응답 비율 (0~1)')
+    parser.add_argument('--tokens-per-second', type=float, default=500, help='응답 토큰 생성 속도')
+    parser.add_argument('--seed', type=int, default=1, help='오류 난수 시드')
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        tokens_per_second=args.tokens_per_second,
+        seed=args.seed
+    )
+    server = create_server(args.host, args.port, config)
+    print(f"🧪 LLM 스텁 서버 시작: http://{args.host}:{server.server_address[1]} "
+          f"(지연 {args.latency}초, 오류율 {args.error_rate:.0%}, 초당 {args.tokens_per_second:g}토큰)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"📊 요청 {config.stats['requests']}개, 오류 {config.stats['errors']}개, "
+              f"출력 {config.stats['output_tokens']:,}토큰")
+
+
+if __name__ == "__main__":
+    main()
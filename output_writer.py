@@ -0,0 +1,106 @@
+# 결과 파일 원자적 기록 + 내용 해시 비교 (바뀐 게 없으면 기록/배포 생략) #
+import hashlib
+import json
+import os
+import tempfile
+
+
+class Volatile(str):
+    """내용 해시에서 빼는 조각 (업데이트 시각처럼 매번 바뀌는 값)"""
+
+
+class OutputWriter:
+    """임시 파일에 쓰고 fsync 후 rename하는 원자적 기록기
+
+    기록 도중 실행이 끊겨도 기존 파일은 그대로 남는다. 조각을 쓰면서 Volatile이 아닌
+    조각만 해시해 지난번 해시(manifest)와 같으면 기존 파일을 건드리지 않는다.
+    changed가 하나라도 있으면 배포가 필요하다.
+    """
+
+    def __init__(self, manifest_path='output_hashes.json'):
+        self.manifest_path = manifest_path
+        self.manifest = self.load()
+        self.changed = []
+        self.unchanged = []
+
+    def load(self):
+        """지난 실행의 파일별 내용 해시 불러오기"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"❌ 출력 해시 기록 불러오기 실패: {e}")
+            return {}
+
+    def save(self):
+        temp_path = self.write_temp(self.manifest_path, [json.dumps(self.manifest, ensure_ascii=False, indent=2)])
+        self.commit(temp_path, self.manifest_path)
+
+    def write_temp(self, path, chunks, hasher=None):
+        """조각을 같은 폴더의 임시 파일에 쓰고 fsync → 임시 파일 경로 (hasher가 있으면 해시도 갱신)"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    if hasher is not None and not isinstance(chunk, Volatile):
+                        hasher.update(chunk.encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+            return temp_path
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def commit(self, temp_path, path):
+        """임시 파일을 실제 경로로 rename (같은 파일시스템이라 원자적) 후 폴더도 fsync"""
+        os.replace(temp_path, path)
+        try:
+            dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+    def write(self, path, chunks):
+        """조각(문자열 또는 반복 가능 객체)을 path에 원자적으로 기록 → 내용이 바뀌었는지"""
+        if isinstance(chunks, str):
+            chunks = [chunks]
+        hasher = hashlib.sha256()
+        temp_path = self.write_temp(path, chunks, hasher)
+        digest = hasher.hexdigest()
+
+        changed = self.manifest.get(path) != digest
+        if not changed and os.path.exists(path):
+            # 시각 외에는 같은 내용 → 기존 파일 유지
+            os.remove(temp_path)
+            self.unchanged.append(path)
+            print(f"⏭️ {path} 내용 변경 없음 → 기록 생략")
+            return False
+
+        self.commit(temp_path, path)
+        if changed:
+            self.manifest[path] = digest
+            self.changed.append(path)
+        else:
+            self.unchanged.append(path)
+        return changed
+
+    def finish(self):
+        """해시 기록 저장 + GitHub Actions 출력(changed=true/false) 남기기"""
+        if self.changed:
+            self.save()
+        changed = 'true' if self.changed else 'false'
+        output_path = os.getenv('GITHUB_OUTPUT')
+        if output_path:
+            with open(output_path, 'a', encoding='utf-8') as f:
+                f.write(f"changed={changed}\n")
+        print(f"📦 바뀐 파일: {len(self.changed)}개, 그대로: {len(self.unchanged)}개 (배포 필요: {changed})")
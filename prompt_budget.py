@@ -0,0 +1,109 @@
+# LLM 프롬프트 토큰 예산 (HTML 제거 + 토큰 추정 + 기사 채우기) #
+import html
+import math
+import re
+from datetime import datetime, timezone
+
+# RSS 요약에 섞여 오는 태그 (script/style은 내용까지 제거)
+SCRIPT_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+SPACE_RE = re.compile(r'\s+')
+
+
+def strip_markup(text):
+    """HTML 태그/엔티티 제거 후 공백 정리"""
+    if not text:
+        return ''
+    text = SCRIPT_RE.sub(' ', text)
+    text = TAG_RE.sub(' ', text)
+    text = html.unescape(text)
+    return SPACE_RE.sub(' ', text).strip()
+
+
+def estimate_tokens(text):
+    """토큰 수 추정 (영문 4글자 ≈ 1토큰, 한글 등 비ASCII는 1글자 ≈ 1토큰으로 넉넉하게)"""
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return math.ceil((len(text) - non_ascii) / 4) + non_ascii
+
+
+def truncate_tokens(text, max_tokens):
+    """추정 토큰 수가 max_tokens 이하가 되도록 단어 단위로 자르기"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    words = text.split(' ')
+    kept = []
+    used = 1  # 말줄임표
+    for word in words:
+        cost = estimate_tokens(word + ' ')
+        if used + cost > max_tokens:
+            break
+        kept.append(word)
+        used += cost
+    return ' '.join(kept).rstrip(' ,.;:') + '…'
+
+
+class PromptBuilder:
+    """토큰 예산 안에 들어가는 만큼 기사를 채워 넣는 프롬프트 빌더
+
+    기사는 묶인 기사 수(cluster_size)가 많고 최신일수록 먼저 넣는다.
+    최신도는 half_life_hours마다 절반으로 줄고, 날짜 미상 기사는 이틀 전 기사로 본다.
+    요약은 HTML을 지운 뒤 summary_tokens까지만 사용한다.
+    """
+
+    def __init__(self, summary_tokens=60, half_life_hours=24):
+        self.summary_tokens = summary_tokens
+        self.half_life_hours = half_life_hours
+
+    def priority(self, article, now):
+        date_obj = article.get('date_obj')
+        age_hours = (now - date_obj).total_seconds() / 3600 if date_obj else 48
+        recency = 0.5 ** (max(age_hours, 0) / self.half_life_hours)
+        return article.get('cluster_size', 1) * recency
+
+    def rank(self, articles, now=None):
+        """우선순위가 높은 기사부터 인덱스 목록 (같으면 원래 순서)"""
+        now = now or datetime.now(timezone.utc)
+        priorities = [self.priority(article, now) for article in articles]
+        return sorted(range(len(articles)), key=lambda i: -priorities[i])
+
+    def title(self, article):
+        return strip_markup(article.get('title', ''))
+
+    def summary(self, article):
+        """HTML을 지우고 예산만큼 자른 요약"""
+        return truncate_tokens(strip_markup(article.get('summary', '')), self.summary_tokens)
+
+    def pack(self, articles, render, max_tokens):
+        """render(번호, 기사) 텍스트를 예산 안에서 채우기 → (선택된 인덱스, 합친 텍스트, 사용 토큰)
+
+        예산을 넘는 기사는 건너뛰고, 뒤쪽의 더 짧은 기사는 계속 넣어 본다.
+        번호는 선택된 순서대로 1부터 붙는다.
+        """
+        selected = []
+        parts = []
+        used = 0
+        for index in self.rank(articles):
+            text = render(len(selected) + 1, articles[index])
+            cost = estimate_tokens(text)
+            if used + cost > max_tokens:
+                continue
+            selected.append(index)
+            parts.append(text)
+            used += cost
+        return selected, ''.join(parts), used
+
+    def shard(self, articles, render, max_tokens):
+        """모든 기사를 예산 안에 들어가는 배치들로 나누기 → [(인덱스 목록, 텍스트, 사용 토큰)]
+
+        우선순위가 높은 기사가 앞 배치에 들어간다. 혼자서도 예산을 넘는 기사는 제외한다.
+        """
+        shards = []
+        remaining = list(range(len(articles)))
+        while remaining:
+            selected, text, used = self.pack([articles[i] for i in remaining], render, max_tokens)
+            if not selected:
+                break
+            shards.append(([remaining[i] for i in selected], text, used))
+            chosen = set(selected)
+            remaining = [index for i, index in enumerate(remaining) if i not in chosen]
+        return shards
@@ -0,0 +1,109 @@
+# 날짜별 아카이브 페이지 증분 빌더 (입력 해시 → 출력 파일 의존성 매니페스트) #
+import hashlib
+import json
+import os
+
+
+def content_hash(value):
+    """JSON으로 바꿀 수 있는 값의 내용 해시 (키 순서와 상관없이 같은 값이면 같은 해시)"""
+    encoded = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class SiteBuilder:
+    """하루치 페이지 입력을 쌓아 두고 archive/YYYY-MM-DD.html 과 archive/index.html 을 증분 빌드
+
+    매니페스트(site_manifest.json)에는 날짜별 입력 해시와, 출력 파일별로 마지막에 빌드할 때 쓴
+    입력 해시를 기록한다. 빌드 버전(템플릿/자산/렌더링 코드)이 그대로면 입력이 바뀐 날짜 페이지와
+    목록 페이지만 다시 만들므로, 기록이 몇 년 쌓여도 하루 빌드는 페이지 두 개로 끝난다.
+    render_day(data, entry) / render_index(entries)는 HTML 조각을 내보내는 함수다.
+    """
+
+    def __init__(self, writer, render_day, render_index, data_dir='archive_data',
+                 archive_dir='archive', manifest_path='site_manifest.json'):
+        self.writer = writer
+        self.render_day = render_day
+        self.render_index = render_index
+        self.data_dir = data_dir
+        self.archive_dir = archive_dir
+        self.manifest_path = manifest_path
+        self.manifest = self.load()
+
+    def load(self):
+        """지난 빌드의 의존성 매니페스트 불러오기"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = {}
+        except Exception as e:
+            print(f"❌ 아카이브 매니페스트 불러오기 실패: {e}")
+            manifest = {}
+        manifest.setdefault('days', {})
+        manifest.setdefault('outputs', {})
+        return manifest
+
+    def save(self):
+        self.writer.write(self.manifest_path, json.dumps(self.manifest, ensure_ascii=False, indent=2))
+
+    def data_path(self, date):
+        return os.path.join(self.data_dir, f"{date}.json")
+
+    def add_day(self, date, data, summary='', generated_at=None):
+        """하루치 입력 저장 (내용이 지난번과 같으면 그대로 두어 해당 페이지를 다시 만들지 않음)"""
+        digest = content_hash(data)
+        if self.manifest['days'].get(date, {}).get('hash') == digest:
+            return False
+        os.makedirs(self.data_dir, exist_ok=True)
+        self.writer.write(self.data_path(date), json.dumps(data, ensure_ascii=False, default=str))
+        self.manifest['days'][date] = {
+            'hash': digest,
+            'summary': summary,
+            'count': len(data.get('articles', [])),
+            'generated_at': generated_at
+        }
+        return True
+
+    def load_day(self, date):
+        try:
+            with open(self.data_path(date), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"❌ {date} 아카이브 입력 불러오기 실패: {e}")
+            return None
+
+    def build(self, version):
+        """입력 해시가 바뀐 페이지만 다시 빌드 → 다시 만든 파일 목록 (version이 바뀌면 전체)"""
+        days = self.manifest['days']
+        outputs = self.manifest['outputs']
+        os.makedirs(self.archive_dir, exist_ok=True)
+        rebuilt = []
+
+        for date in sorted(days):
+            entry = days[date]
+            path = f"{self.archive_dir}/{date}.html"
+            input_hash = content_hash([version, entry['hash']])
+            if outputs.get(path) == input_hash:
+                continue
+            data = self.load_day(date)
+            if data is None:
+                continue
+            self.writer.write(path, self.render_day(data, entry))
+            outputs[path] = input_hash
+            rebuilt.append(path)
+
+        # 목록 페이지는 날짜/요약/기사 수에만 의존 (생성 시각은 제외)
+        entries = [
+            {'date': date, 'summary': days[date]['summary'], 'count': days[date]['count']}
+            for date in sorted(days, reverse=True)
+        ]
+        path = f"{self.archive_dir}/index.html"
+        input_hash = content_hash([version, entries])
+        if outputs.get(path) != input_hash:
+            self.writer.write(path, self.render_index(entries))
+            outputs[path] = input_hash
+            rebuilt.append(path)
+
+        self.save()
+        print(f"🗂️ 아카이브 {len(days)}일치 중 {len(rebuilt)}개 페이지 다시 빌드")
+        return rebuilt
@@ -0,0 +1,26 @@
+// AI 뉴스 데일리: 새 빌드가 있을 때만 새로고침 (페이지 전체 대신 작은 version.json만 확인)
+(function () {
+    var CHECK_INTERVAL = 30 * 60 * 1000;
+    var meta = document.querySelector('meta[name="build-version"]');
+    var current = meta ? meta.content : null;
+    if (!current || !window.fetch) {
+        return;
+    }
+
+    function checkVersion() {
+        fetch('version.json', { cache: 'no-store' })
+            .then(function (response) {
+                return response.ok ? response.json() : null;
+            })
+            .then(function (manifest) {
+                if (manifest && manifest.version && manifest.version !== current) {
+                    location.reload();
+                }
+            })
+            .catch(function () {
+                // 오프라인 등으로 확인 실패 → 다음 주기에 다시 확인
+            });
+    }
+
+    setInterval(checkVersion, CHECK_INTERVAL);
+})();
@@ -0,0 +1,139 @@
+# 유사 기사 묶기 (MinHash 서명 + LSH 인덱스) #
+import random
+import re
+import zlib
+from collections import Counter
+
+# MinHash 순열용 큰 소수 (2^61 - 1)
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+TAG_RE = re.compile(r'<[^>]+>')
+WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+class StoryClusterer:
+    """제목+요약이 거의 같은 기사(여러 매체에 실린 같은 소식)를 하나의 스토리로 묶기
+
+    기사마다 MinHash 서명을 만들고 밴드별로 LSH 버킷에 넣어, 같은 버킷에 들어간
+    후보끼리만 비교한다. 기사 수가 늘어도 전체 쌍을 비교하지 않는다.
+    같은 매체의 기사끼리는 묶지 않고, 한 매체의 여러 기사에 반복되는 문구(재게재 안내 같은
+    요약 꼬리말)는 서명에서 뺀다. 요약이 같아도 제목이 다르면 다른 소식으로 본다.
+    """
+
+    def __init__(self, num_perm=64, bands=16, shingle_size=2, threshold=0.5, title_threshold=0.2,
+                 boilerplate_min=3, seed=1):
+        # 서명 길이 / LSH 밴드 수 / 단어 n-gram 크기 / 같은 스토리로 볼 추정 유사도
+        # title_threshold: 제목 단어 Jaccard 유사도 하한 (공통 꼬리말만 같은 기사 구분)
+        # boilerplate_min: 같은 매체에서 이만큼 이상의 기사에 나오는 n-gram은 상투 문구로 보고 제외
+        self.title_threshold = title_threshold
+        self.boilerplate_min = boilerplate_min
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+
+        # 실행마다 같은 결과가 나오도록 고정 시드로 순열 계수 생성
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randint(1, MERSENNE_PRIME - 1), rng.randint(0, MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def shingles(self, article):
+        """제목+요약 → 단어 n-gram 해시 집합"""
+        text = f"{article.get('title', '')} {TAG_RE.sub(' ', article.get('summary', ''))}"
+        words = WORD_RE.findall(text.lower())
+        size = self.shingle_size
+        if len(words) < size:
+            grams = [' '.join(words)] if words else []
+        else:
+            grams = [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+        return {zlib.crc32(gram.encode('utf-8')) for gram in grams}
+
+    def title_words(self, article):
+        """제목의 세 글자 이상 단어 집합"""
+        return {word for word in WORD_RE.findall(article.get('title', '').lower()) if len(word) >= 3}
+
+    def title_similarity(self, words_a, words_b):
+        if not words_a or not words_b:
+            return 0.0
+        return len(words_a & words_b) / len(words_a | words_b)
+
+    def strip_boilerplate(self, articles, shingle_sets):
+        """매체별로 여러 기사에 반복되는 n-gram을 빼기 (기사 내용이 아닌 공통 꼬리말)"""
+        counts = {}
+        for article, shingles in zip(articles, shingle_sets):
+            counts.setdefault(article.get('source'), Counter()).update(shingles)
+        return [
+            {value for value in shingles if counts[article.get('source')][value] < self.boilerplate_min}
+            for article, shingles in zip(articles, shingle_sets)
+        ]
+
+    def signature(self, shingles):
+        """MinHash 서명 (순열마다 최솟값)"""
+        if not shingles:
+            return None
+        return tuple(
+            min(((a * value + b) % MERSENNE_PRIME) & MAX_HASH for value in shingles)
+            for a, b in self.permutations
+        )
+
+    def similarity(self, sig_a, sig_b):
+        """서명 일치 비율 = 추정 Jaccard 유사도"""
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / self.num_perm
+
+    def cluster(self, articles):
+        """기사 목록 → 스토리 묶음 목록 (처음 등장한 순서 유지)"""
+        parent = list(range(len(articles)))
+        # 묶음(루트)별 매체 집합: 같은 매체 기사가 한 묶음에 들어가지 않게 함
+        sources = [{article.get('source')} for article in articles]
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        shingle_sets = self.strip_boilerplate(articles, [self.shingles(article) for article in articles])
+        signatures = [self.signature(shingles) for shingles in shingle_sets]
+        titles = [self.title_words(article) for article in articles]
+        buckets = {}
+        for i, sig in enumerate(signatures):
+            if sig is None:
+                continue
+            for band in range(self.bands):
+                key = (band, sig[band * self.rows:(band + 1) * self.rows])
+                for j in buckets.setdefault(key, []):
+                    root_i, root_j = find(i), find(j)
+                    if root_i == root_j or sources[root_i] & sources[root_j]:
+                        continue
+                    if (self.similarity(sig, signatures[j]) >= self.threshold
+                            and self.title_similarity(titles[i], titles[j]) >= self.title_threshold):
+                        root, child = min(root_i, root_j), max(root_i, root_j)
+                        parent[child] = root
+                        sources[root] |= sources[child]
+                buckets[key].append(i)
+
+        clusters = {}
+        for i in range(len(articles)):
+            clusters.setdefault(find(i), []).append(articles[i])
+        return list(clusters.values())
+
+    def merge(self, articles):
+        """스토리별 대표 기사(가장 최신)만 남기고 나머지 매체는 대표 기사에 붙이기"""
+        representatives = []
+        for group in self.cluster(articles):
+            representative = group[0]
+            for article in group[1:]:
+                if article['date_obj'] and (
+                        not representative['date_obj'] or article['date_obj'] > representative['date_obj']):
+                    representative = article
+            representative['cluster_size'] = len(group)
+            representative['related_sources'] = [
+                {'source': article['source'], 'title': article['title'], 'link': article['link']}
+                for article in group if article is not representative
+            ]
+            representatives.append(representative)
+        return representatives
@@ -0,0 +1,72 @@
+# HTML 템플릿 렌더러 (한 번 컴파일해 재사용, 리스트에 조각을 모아 출력) #
+import hashlib
+import os
+from string import Formatter
+
+
+class TemplateRenderer:
+    """templates/ 폴더의 HTML 템플릿을 컴파일해 캐시하는 렌더러
+
+    템플릿 문법은 str.format과 같다 ({name} 자리 채우기, 중괄호 자체는 {{ }}).
+    컴파일하면 (고정 텍스트, 필드 이름) 목록이 되고, 렌더링은 이 목록을 돌며
+    조각을 내보내기만 하므로 카드가 몇 천 개여도 문자열 이어 붙이기 없이
+    선형 시간에 끝난다.
+    """
+
+    def __init__(self, template_dir='templates'):
+        self.template_dir = template_dir
+        self.compiled = {}
+
+    def compile(self, name):
+        """템플릿 파일 → [(고정 텍스트, 필드 이름 또는 None)] (처음 한 번만 읽고 파싱)"""
+        parts = self.compiled.get(name)
+        if parts is None:
+            with open(os.path.join(self.template_dir, name), 'r', encoding='utf-8') as f:
+                source = f.read()
+            parts = [
+                (literal, field_name or None)
+                for literal, field_name, _, _ in Formatter().parse(source)
+            ]
+            self.compiled[name] = parts
+        return parts
+
+    def fingerprint(self):
+        """템플릿 폴더 전체 내용의 해시 (템플릿이 바뀌면 이미 만든 페이지를 다시 빌드하는 기준)"""
+        digest = hashlib.sha256()
+        for name in sorted(os.listdir(self.template_dir)):
+            with open(os.path.join(self.template_dir, name), 'rb') as f:
+                digest.update(name.encode('utf-8'))
+                digest.update(f.read())
+        return digest.hexdigest()[:12]
+
+    def iter_render(self, name, context):
+        """템플릿을 채운 조각을 차례로 내보내기
+
+        context 값이 문자열이 아닌 반복 가능 객체(제너레이터 등)면 그 조각을 그대로 이어서
+        내보내므로, 뉴스 카드 목록을 메모리에 다 만들지 않고 파일로 바로 흘려보낼 수 있다.
+        """
+        for literal, field_name in self.compile(name):
+            if literal:
+                yield literal
+            if field_name is not None:
+                value = context[field_name]
+                if isinstance(value, str):
+                    # str 하위 클래스(output_writer.Volatile 등)는 그대로 넘김
+                    yield value
+                elif hasattr(value, '__iter__'):
+                    yield from value
+                else:
+                    yield str(value)
+
+    def iter_render_each(self, name, contexts):
+        """같은 템플릿을 여러 context로 채운 조각을 차례로 내보내기"""
+        for context in contexts:
+            yield from self.iter_render(name, context)
+
+    def render(self, name, context):
+        """템플릿을 채운 문자열"""
+        return ''.join(self.iter_render(name, context))
+
+    def render_each(self, name, contexts):
+        """같은 템플릿을 여러 context로 채워 이어 붙인 문자열"""
+        return ''.join(self.iter_render_each(name, contexts))
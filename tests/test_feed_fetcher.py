@@ -0,0 +1,38 @@
+# 피드 수집 마감 시간 테스트 #
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_process_exits_near_total_timeout_on_long_retry_after():
+    """503 + 긴 Retry-After를 보내는 피드가 있어도 프로세스가 total_timeout 근처에서 끝나야 함"""
+    script = textwrap.dedent("""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        from feed_fetcher import FeedFetcher
+
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                self.send_response(503)
+                self.send_header('Retry-After', '12')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        fetcher = FeedFetcher(feed_timeout=2, total_timeout=3)
+        fetcher.fetch_all([f'http://127.0.0.1:{server.server_address[1]}/feed.xml'])
+    """)
+    started = time.monotonic()
+    subprocess.run([sys.executable, '-c', script], cwd=ROOT, timeout=60, capture_output=True)
+    assert time.monotonic() - started < 8
@@ -0,0 +1,16 @@
+# 토큰화 + 키워드 매칭 테스트 #
+from keyword_matcher import KeywordMatcher, tokenize
+
+
+def test_hyphenated_words_are_split():
+    tokens = tokenize("Voice-enabled robotics and vision-language computer-vision")
+    assert tokens == ['Voice', 'enabled', 'robotics', 'and', 'vision', 'language', 'computer', 'vision']
+
+
+def test_versioned_names_match_as_multi_token_patterns():
+    matcher = KeywordMatcher({
+        tuple(tokenize('gpt-4')): 'GPT-4',
+        tuple(tokenize('claude 3.5')): 'Claude 3.5',
+    })
+    text = [token.lower() for token in tokenize("GPT-4 beats Claude 3.5 on television benchmarks")]
+    assert matcher.count(text) == {'GPT-4': 1, 'Claude 3.5': 1}
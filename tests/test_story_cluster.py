@@ -0,0 +1,40 @@
+# 유사 기사 묶기 테스트 #
+from story_cluster import StoryClusterer
+
+FOOTER = ("This story was originally published by our partner newsroom and is republished here "
+          "with permission under a content sharing agreement for readers of this site")
+
+HEADLINES = [
+    "Nvidia unveils new inference chip for data centers",
+    "European regulators open probe into AI hiring tools",
+    "Startup raises funding for robotic warehouse pickers",
+    "Hospital network deploys speech model for clinical notes",
+    "Open source model tops coding benchmark leaderboard",
+    "Chipmaker delays fab expansion amid export rules",
+    "Bank pilots chatbot for small business lending",
+    "University lab releases dataset for weather forecasting",
+]
+
+
+def make_article(title, summary, source):
+    return {'title': title, 'summary': summary, 'source': source, 'link': f'https://example.com/{title}',
+            'date_obj': None}
+
+
+def test_distinct_titles_over_shared_summary_stay_separate():
+    for sources in (['feed'] * len(HEADLINES), [f'feed{i}' for i in range(len(HEADLINES))]):
+        articles = [make_article(title, FOOTER, source) for title, source in zip(HEADLINES, sources)]
+        assert len(StoryClusterer().merge(articles)) == len(HEADLINES)
+
+
+def test_same_story_from_different_sources_is_merged():
+    summary = "OpenAI released GPT-5 on Tuesday with better reasoning and lower prices for developers"
+    articles = [
+        make_article("OpenAI launches GPT-5 with better reasoning", summary, 'a'),
+        make_article("OpenAI launches GPT-5, cuts developer prices", summary, 'b'),
+        make_article("OpenAI launches GPT-5 model", summary, 'a'),
+    ]
+    merged = StoryClusterer().merge(articles)
+    # 같은 매체(a)의 두 기사는 한 묶음이 되지 않음
+    assert len(merged) == 2
+    assert max(article['cluster_size'] for article in merged) == 2
@@ -0,0 +1,22 @@
+# 키워드 트렌드 점수 테스트 #
+import numpy as np
+
+from trend_scoring import TrendScorer
+
+
+def label_one(today, history):
+    scorer = TrendScorer()
+    matrix = np.array([history], dtype=np.float64)
+    return scorer.label([today], scorer.score([today], matrix))[0]
+
+
+def test_one_off_word_is_not_tagged():
+    assert label_one(1, [0, 0, 0, 0, 0, 0, 0]) == ''
+
+
+def test_unseen_word_with_enough_mentions_is_new():
+    assert label_one(3, [0, 0, 0, 0, 0, 0, 0]) == '🆕 NEW'
+
+
+def test_seen_word_above_baseline_is_rising():
+    assert label_one(4, [1, 2, 1, 2, 1, 2, 2]) == '📈 RISING'
@@ -0,0 +1,70 @@
+# 키워드 트렌드 점수 계산 (NumPy 벡터 연산) #
+import numpy as np
+
+
+class TrendScorer:
+    """키워드 × 날짜 빈도 행렬로 모든 키워드의 트렌드를 한 번에 계산
+
+    - z-score: 과거 평균/표준편차 대비 오늘 빈도 (빈도가 작을 때는 포아송 잡음 하한 적용)
+    - EWMA: 최근 날짜에 가중치를 더 준 기준값
+    - 버스트: 오늘 빈도가 EWMA의 burst_ratio배 이상이면서 z-score도 높은 경우
+    """
+
+    def __init__(self, ewma_alpha=0.3, hot_z=2.5, rising_z=1.0, burst_ratio=2.0, min_count=2):
+        self.ewma_alpha = ewma_alpha
+        self.hot_z = hot_z
+        self.rising_z = rising_z
+        self.burst_ratio = burst_ratio
+        self.min_count = min_count
+
+    def build_matrix(self, keywords, days, history):
+        """{키워드: {날짜: 빈도}} → (키워드 수 × 날짜 수) 행렬 (기록 없는 칸은 0)"""
+        day_index = {day: j for j, day in enumerate(days)}
+        matrix = np.zeros((len(keywords), len(days)), dtype=np.float64)
+        for i, keyword in enumerate(keywords):
+            for day, count in history.get(keyword, {}).items():
+                j = day_index.get(day)
+                if j is not None:
+                    matrix[i, j] = count
+        return matrix
+
+    def ewma_weights(self, num_days):
+        """가장 최근 날짜가 가장 큰 EWMA 가중치 (합 1)"""
+        weights = self.ewma_alpha * (1 - self.ewma_alpha) ** np.arange(num_days - 1, -1, -1)
+        return weights / weights.sum()
+
+    def score(self, today, matrix):
+        """오늘 빈도 벡터(K)와 과거 행렬(K × D) → 지표 배열 dict"""
+        today = np.asarray(today, dtype=np.float64)
+        if matrix.shape[1] == 0:
+            zeros = np.zeros_like(today)
+            return {
+                'mean': zeros, 'ewma': zeros, 'z': zeros,
+                'seen': np.zeros(today.shape, dtype=bool), 'burst': np.zeros(today.shape, dtype=bool)
+            }
+
+        mean = matrix.mean(axis=1)
+        var = matrix.var(axis=1)
+        # 표본이 적고 빈도가 낮으면 분산이 0에 가까우므로 포아송 분산(=평균) + 1을 하한으로
+        sigma = np.sqrt(np.maximum(var, mean) + 1.0)
+        z = (today - mean) / sigma
+
+        ewma = matrix @ self.ewma_weights(matrix.shape[1])
+        seen = matrix.sum(axis=1) > 0
+        burst = seen & (today >= self.min_count) & (today >= self.burst_ratio * np.maximum(ewma, 1.0)) & (z >= self.hot_z)
+
+        return {'mean': mean, 'ewma': ewma, 'z': z, 'seen': seen, 'burst': burst}
+
+    def label(self, today, metrics):
+        """지표 → 트렌드 태그 목록 (NEW, HOT, RISING)"""
+        today = np.asarray(today, dtype=np.float64)
+        tags = np.full(today.shape, '', dtype=object)
+        # 한 번 나온 단어가 태그를 달지 않도록 NEW/HOT처럼 최소 빈도와 과거 등장 여부를 요구
+        rising = (
+            metrics['seen'] & (today >= self.min_count)
+            & (metrics['z'] >= self.rising_z) & (today > metrics['ewma'])
+        )
+        tags[rising] = '📈 RISING'
+        tags[metrics['burst']] = '🔥 HOT'
+        tags[~metrics['seen'] & (today >= self.min_count)] = '🆕 NEW'
+        return tags.tolist()